@@ -13,7 +13,7 @@ from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QProgre
 from PySide6.QtCore import Qt, QTimer, QPoint, QPointF, QRectF, QPropertyAnimation, QEasingCurve, Property
 from PySide6.QtGui import (
     QPainter, QColor, QPen, QBrush, QPainterPath, QFont, QGuiApplication,
-    QRadialGradient, QLinearGradient,
+    QPixmap, QRadialGradient, QLinearGradient,
 )
 from state_manager import StateManager, SessionState
 from themes import get_theme, get_overlay_colors
@@ -257,7 +257,7 @@ class ActivityIndicator(QWidget):
                 glow.setColorAt(0.0, glow_inner)
                 glow.setColorAt(0.6, glow_inner)
                 glow.setColorAt(1.0, glow_outer)
-                painter.setBrush(QBrush(glow))
+                painter.setBrush(glow)
                 painter.setPen(Qt.NoPen)
                 painter.drawEllipse(
                     QPointF(center_x, center_y), glow_radius, glow_radius
@@ -265,7 +265,7 @@ class ActivityIndicator(QWidget):
 
                 # --- Drop shadow ---
                 shadow = QColor(0, 0, 0, int(60 * sq_opacity))
-                painter.setBrush(QBrush(shadow))
+                painter.setBrush(shadow)
                 painter.drawRoundedRect(
                     int(x + 2), int(y + 2), square_size, square_size, 5, 5
                 )
@@ -278,7 +278,7 @@ class ActivityIndicator(QWidget):
                 bot_color.setAlphaF(sq_opacity * 0.75)
                 sq_grad.setColorAt(0.0, top_color)
                 sq_grad.setColorAt(1.0, bot_color)
-                painter.setBrush(QBrush(sq_grad))
+                painter.setBrush(sq_grad)
                 painter.drawRoundedRect(x, y, square_size, square_size, 5, 5)
 
                 # --- Specular highlight (top half gloss) ---
@@ -287,7 +287,7 @@ class ActivityIndicator(QWidget):
                 hl_bot = QColor(255, 255, 255, 0)
                 hl_grad.setColorAt(0.0, hl_top)
                 hl_grad.setColorAt(1.0, hl_bot)
-                painter.setBrush(QBrush(hl_grad))
+                painter.setBrush(hl_grad)
                 painter.drawRoundedRect(
                     x + 2, y + 1,
                     square_size - 4, int(square_size * 0.45),
@@ -296,7 +296,7 @@ class ActivityIndicator(QWidget):
             else:
                 # --- Dim square ---
                 dim = QColor(80, 80, 85, int(35 * self.opacity_value))
-                painter.setBrush(QBrush(dim))
+                painter.setBrush(dim)
                 painter.setPen(Qt.NoPen)
                 painter.drawRoundedRect(x, y, square_size, square_size, 5, 5)
 
@@ -304,7 +304,7 @@ class ActivityIndicator(QWidget):
         for p in self._particles:
             p_color = QColor(self.color)
             p_color.setAlphaF(max(0.0, min(1.0, p['life'] * 0.5)))
-            painter.setBrush(QBrush(p_color))
+            painter.setBrush(p_color)
             painter.setPen(Qt.NoPen)
             painter.drawEllipse(QPointF(p['x'], p['y']), p['size'], p['size'])
 
@@ -365,7 +365,7 @@ class TimelineStrip(QWidget):
             seg_width = max(1.0, (weight / total_weight) * available)
             c = QColor(color)
             c.setAlphaF(0.7)
-            painter.setBrush(QBrush(c))
+            painter.setBrush(c)
             painter.setPen(Qt.NoPen)
             painter.drawRoundedRect(QRectF(x, 0, seg_width, self.height()), 2, 2)
             x += seg_width + gap
@@ -438,6 +438,7 @@ class SessionCard(QWidget):
         self.theme_colors = theme_colors or get_overlay_colors(get_theme("dark"))
         self._flash_opacity = 0.0
         self._flash_animation = None
+        self._displayed_revision = None  # session.revision last shown
 
         # Setup UI
         self._setup_ui()
@@ -534,7 +535,7 @@ class SessionCard(QWidget):
             attention_config = self.config.get_attention_config(tool.attention)
 
             # Duration evolution: slow animation for long-running tools
-            elapsed = time.time() - tool.started_at
+            elapsed = time.monotonic() - tool.started_at
             level_name, duration_mult = self.config.get_duration_speed_mult(elapsed)
 
             # Detect tool change or duration level change — only then call set_pattern
@@ -610,7 +611,7 @@ class SessionCard(QWidget):
             painter.setRenderHint(QPainter.Antialiasing)
             red = QColor(239, 68, 68)
             red.setAlphaF(self._flash_opacity)
-            painter.setBrush(QBrush(red))
+            painter.setBrush(red)
             painter.setPen(Qt.NoPen)
             path = QPainterPath()
             path.addRoundedRect(QRectF(0, 0, self.width(), self.height()), 8, 8)
@@ -652,6 +653,7 @@ class MiniSessionCard(QWidget):
         self.config = config
         self.user_settings = user_settings
         self.theme_colors = theme_colors or get_overlay_colors(get_theme("dark"))
+        self._displayed_revision = None  # session.revision last shown
 
         self.setFixedHeight(26)
         self._setup_ui()
@@ -750,7 +752,7 @@ class _ColorDot(QWidget):
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(QBrush(self.color))
+        painter.setBrush(self.color)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(0, 0, 8, 8)
 
@@ -774,11 +776,29 @@ class ClaudeNotchOverlay(QWidget):
         self._user_dragged = False  # True after user drags overlay
         self._is_fading_out = False  # Guard against show during hide cleanup
         self._accent_color = None   # Current border accent color
+        self._update_pending = False  # Coalesces repaint requests per tick
+        self._pending_move_pos = None  # Latest drag target (coalesced)
+        self._move_scheduled = False
+        # Cached pre-rendered accent strip (line + glow), rebuilt only when
+        # color/width change
+        self._accent_cache_key = None
+        self._accent_pixmap = None
         self._mini_mode = user_settings.get("mini_mode") if user_settings else False
         self._theme_colors = get_overlay_colors(get_theme(
             user_settings.get("theme") if user_settings else "dark"
         ))
 
+        # RAM-backed copies of settings read on every paint/animation tick,
+        # refreshed in _on_setting_changed instead of queried per call.
+        if user_settings:
+            self._animations_enabled = user_settings.get("animations_enabled")
+            self._auto_hide = user_settings.get("auto_hide")
+            self._bg_opacity = user_settings.get("background_opacity")
+        else:
+            self._animations_enabled = True
+            self._auto_hide = True
+            self._bg_opacity = 220
+
         # Window flags for overlay
         self.setWindowFlags(
             Qt.WindowStaysOnTopHint |
@@ -896,6 +916,22 @@ class ClaudeNotchOverlay(QWidget):
             return None
         return self.config.get_color_rgb(color_name)
 
+    def _request_update(self):
+        """Schedule a repaint, coalescing requests within one event-loop tick.
+
+        Several setting-change branches can each ask for a repaint in the
+        same tick; deferring through a zero-timeout timer lets Qt merge them
+        into a single paintEvent.
+        """
+        if self._update_pending:
+            return
+        self._update_pending = True
+        QTimer.singleShot(0, self._do_pending_update)
+
+    def _do_pending_update(self):
+        self._update_pending = False
+        self.update()
+
     def _update_accent_color(self):
         """Determine accent color: project color > tool color > None."""
         for card in self.session_cards.values():
@@ -905,18 +941,18 @@ class ClaudeNotchOverlay(QWidget):
                 new_color = QColor(*project_rgb)
                 if self._accent_color != new_color:
                     self._accent_color = new_color
-                    self.update()
+                    self._request_update()
                 return
             if card.session.active_tool:
                 color_rgb = self.config.get_color_rgb(card.session.active_tool.color)
                 new_color = QColor(*color_rgb)
                 if self._accent_color != new_color:
                     self._accent_color = new_color
-                    self.update()  # repaint border accent
+                    self._request_update()  # repaint border accent
                 return
         if self._accent_color is not None:
             self._accent_color = None
-            self.update()
+            self._request_update()
 
     def _update_sessions(self):
         """Update session cards based on current state."""
@@ -933,10 +969,12 @@ class ClaudeNotchOverlay(QWidget):
         # Update or create cards
         for session in sessions:
             if session.session_id in self.session_cards:
-                # Update existing card
+                # Update existing card — skip repaint work if unchanged
                 card = self.session_cards[session.session_id]
                 card.session = session
-                card.update_display()
+                if card._displayed_revision != session.revision:
+                    card.update_display()
+                    card._displayed_revision = session.revision
             else:
                 # Create new card (mini or full)
                 if self._mini_mode:
@@ -950,12 +988,8 @@ class ClaudeNotchOverlay(QWidget):
         self._update_accent_color()
 
         # Show/hide window based on activity and auto_hide setting
-        auto_hide = True
-        if self.user_settings:
-            auto_hide = self.user_settings.get("auto_hide")
-
         should_show = False
-        if auto_hide:
+        if self._auto_hide:
             should_show = bool(sessions) and not self.state_manager.is_idle
         else:
             should_show = bool(sessions)
@@ -976,9 +1010,14 @@ class ClaudeNotchOverlay(QWidget):
 
     def _periodic_update(self):
         """Periodic update."""
-        # Update all session cards
+        # Update session cards whose state changed; unchanged cards only
+        # advance their animation (duration evolution) — no label/paint work.
         for card in self.session_cards.values():
-            card.update_display()
+            if card._displayed_revision != card.session.revision:
+                card.update_display()
+                card._displayed_revision = card.session.revision
+            else:
+                card.update_animation()
         self._update_accent_color()
 
     def paintEvent(self, event):
@@ -987,12 +1026,9 @@ class ClaudeNotchOverlay(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw rounded rectangle background
-        opacity = 220
-        if self.user_settings:
-            opacity = self.user_settings.get("background_opacity")
         bg_rgb = self._theme_colors["bg_rgb"]
-        bg_color = QColor(*bg_rgb, opacity)
-        painter.setBrush(QBrush(bg_color))
+        bg_color = QColor(*bg_rgb, self._bg_opacity)
+        painter.setBrush(bg_color)
         painter.setPen(Qt.NoPen)
 
         path = QPainterPath()
@@ -1000,46 +1036,70 @@ class ClaudeNotchOverlay(QWidget):
         painter.drawPath(path)
 
         # --- Border accent (colored line at top, reflecting active tool) ---
-        if self._accent_color:
+        # Only the top 10px strip contains accent/glow; skip it entirely when a
+        # partial repaint doesn't touch that strip, and clamp draws to the
+        # dirty region so exposing a slice only shades that slice.
+        dirty = event.rect()
+        if self._accent_color and dirty.top() <= 10:
             painter.setClipPath(path)
 
-            # Gradient accent line that fades at the edges
-            accent_grad = QLinearGradient(0, 0, self.width(), 0)
-            ac_transparent = QColor(self._accent_color)
-            ac_transparent.setAlphaF(0.0)
-            ac_solid = QColor(self._accent_color)
-            ac_solid.setAlphaF(0.7)
-            accent_grad.setColorAt(0.0, ac_transparent)
-            accent_grad.setColorAt(0.15, ac_solid)
-            accent_grad.setColorAt(0.85, ac_solid)
-            accent_grad.setColorAt(1.0, ac_transparent)
-
-            painter.setPen(QPen(QBrush(accent_grad), 2))
-            painter.setBrush(Qt.NoBrush)
-            painter.drawLine(QPointF(0, 1), QPointF(self.width(), 1))
-
-            # Soft glow bleed below the accent line
-            glow_grad = QLinearGradient(0, 0, 0, 10)
-            g_top = QColor(self._accent_color)
-            g_top.setAlphaF(0.12)
-            g_bot = QColor(self._accent_color)
-            g_bot.setAlphaF(0.0)
-            glow_grad.setColorAt(0, g_top)
-            glow_grad.setColorAt(1, g_bot)
-            painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(glow_grad))
-            painter.drawRect(QRectF(0, 0, self.width(), 10))
+            left = max(0, dirty.left())
+            right = min(self.width(), dirty.right() + 1)
+
+            # Render the accent strip (gradient line + glow) into a pixmap
+            # once per (color, width); repaints then blit the cached pixels
+            # instead of re-evaluating gradients per pixel.
+            cache_key = (self._accent_color.rgba(), self.width())
+            if cache_key != self._accent_cache_key:
+                self._accent_cache_key = cache_key
+                self._accent_pixmap = self._render_accent_strip()
+
+            painter.drawPixmap(left, 0, self._accent_pixmap,
+                               left, 0, right - left, 10)
 
             painter.setClipping(False)
 
+    def _render_accent_strip(self) -> QPixmap:
+        """Pre-render the accent line and glow into a width x 10 pixmap."""
+        pixmap = QPixmap(self.width(), 10)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Gradient accent line that fades at the edges
+        accent_grad = QLinearGradient(0, 0, self.width(), 0)
+        ac_transparent = QColor(self._accent_color)
+        ac_transparent.setAlphaF(0.0)
+        ac_solid = QColor(self._accent_color)
+        ac_solid.setAlphaF(0.7)
+        accent_grad.setColorAt(0.0, ac_transparent)
+        accent_grad.setColorAt(0.15, ac_solid)
+        accent_grad.setColorAt(0.85, ac_solid)
+        accent_grad.setColorAt(1.0, ac_transparent)
+
+        painter.setPen(QPen(QBrush(accent_grad), 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawLine(QPointF(0, 1), QPointF(self.width(), 1))
+
+        # Soft glow bleed below the accent line
+        glow_grad = QLinearGradient(0, 0, 0, 10)
+        g_top = QColor(self._accent_color)
+        g_top.setAlphaF(0.12)
+        g_bot = QColor(self._accent_color)
+        g_bot.setAlphaF(0.0)
+        glow_grad.setColorAt(0, g_top)
+        glow_grad.setColorAt(1, g_bot)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(glow_grad)
+        painter.drawRect(QRectF(0, 0, self.width(), 10))
+
+        painter.end()
+        return pixmap
+
     def _animated_show(self):
         """Show overlay with fade-in animation."""
-        animations_enabled = True
-        if self.user_settings:
-            animations_enabled = self.user_settings.get("animations_enabled")
-
         self._is_fading_out = False
-        if not animations_enabled:
+        if not self._animations_enabled:
             self.setWindowOpacity(1.0)
             self.show()
             return
@@ -1062,11 +1122,7 @@ class ClaudeNotchOverlay(QWidget):
 
     def _animated_hide(self):
         """Hide overlay with fade-out animation."""
-        animations_enabled = True
-        if self.user_settings:
-            animations_enabled = self.user_settings.get("animations_enabled")
-
-        if not animations_enabled:
+        if not self._animations_enabled:
             self.hide()
             return
 
@@ -1123,15 +1179,19 @@ class ClaudeNotchOverlay(QWidget):
             self._user_dragged = False
             self._position_window()
         elif key == "background_opacity":
-            self.update()  # triggers paintEvent
+            self._bg_opacity = self.user_settings.get("background_opacity")
+            self._request_update()  # triggers paintEvent
         elif key == "auto_hide":
+            self._auto_hide = self.user_settings.get("auto_hide")
             self._update_sessions()
         elif key in ("animation_speed_multiplier", "animations_enabled"):
+            if key == "animations_enabled":
+                self._animations_enabled = self.user_settings.get("animations_enabled")
             for card in self.session_cards.values():
                 card.update_animation()
         elif key == "theme":
             self._theme_colors = get_overlay_colors(get_theme(self.user_settings.get("theme")))
-            self.update()  # repaint background
+            self._request_update()  # repaint background
             for card in self.session_cards.values():
                 card.theme_colors = self._theme_colors
                 card.update_display()
@@ -1155,8 +1215,23 @@ class ClaudeNotchOverlay(QWidget):
             event.accept()
 
     def mouseMoveEvent(self, event):
-        """Handle mouse move for dragging."""
+        """Handle mouse move for dragging.
+
+        Moves are coalesced to one per event-loop tick: high-polling-rate
+        mice deliver move events far faster than the window manager can
+        reposition, so only the latest target position is applied.
+        """
         if event.buttons() == Qt.LeftButton:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
+            self._pending_move_pos = event.globalPosition().toPoint() - self.drag_position
             self._user_dragged = True
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QTimer.singleShot(0, self._apply_pending_move)
             event.accept()
+
+    def _apply_pending_move(self):
+        """Apply the most recent drag position (coalesced)."""
+        self._move_scheduled = False
+        if self._pending_move_pos is not None:
+            self.move(self._pending_move_pos)
+            self._pending_move_pos = None
@@ -2,8 +2,11 @@ import json
 import logging
 import os
 import tempfile
+import threading
 import time
 from pathlib import Path
+from types import MappingProxyType
+from PySide6.QtCore import QRunnable, QThreadPool
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +14,37 @@ SCHEMA_VERSION = 1
 PRUNE_AFTER_DAYS = 90
 
 
+class _SaveTask(QRunnable):
+    """Background writer: drains the pending payload for one stats file."""
+
+    def __init__(self, stats_dir: Path, stats_file: Path):
+        super().__init__()
+        self.stats_dir = stats_dir
+        self.stats_file = stats_file
+
+    def run(self):
+        path_key = str(self.stats_file)
+        while True:
+            with SessionStats._io_lock:
+                payload = SessionStats._pending_writes.get(path_key)
+                if payload is None:
+                    return
+            SessionStats._write_payload(self.stats_dir, self.stats_file, payload)
+            with SessionStats._io_lock:
+                # Only clear if no newer payload was queued while writing
+                if SessionStats._pending_writes.get(path_key) == payload:
+                    del SessionStats._pending_writes[path_key]
+                    return
+
+
 class SessionStats:
+    # Class-level so instances created without __init__ (tests) still share
+    # the same write-back cache. Maps str(stats_file) -> serialized payload
+    # not yet flushed to disk; _load consults it so reads stay consistent
+    # even while a background write is in flight.
+    _io_lock = threading.Lock()
+    _pending_writes: dict = {}
+
     def __init__(self):
         self.stats_dir = Path.home() / "AppData" / "Roaming" / "claude-notch-windows"
         self.stats_file = self.stats_dir / "session_stats.json"
@@ -30,11 +63,17 @@ class SessionStats:
         }
 
     def _load(self):
-        if not self.stats_file.exists():
+        # Prefer a payload still queued for writing over what's on disk
+        with SessionStats._io_lock:
+            pending = SessionStats._pending_writes.get(str(self.stats_file))
+        if pending is None and not self.stats_file.exists():
             return
         try:
-            with open(self.stats_file, "r") as f:
-                data = json.load(f)
+            if pending is not None:
+                data = json.loads(pending)
+            else:
+                with open(self.stats_file, "r") as f:
+                    data = json.load(f)
             if data.get("schema_version") != SCHEMA_VERSION:
                 logger.warning("session_stats.json schema mismatch, resetting")
                 return
@@ -44,12 +83,30 @@ class SessionStats:
             logger.error(f"Failed to load session stats: {e}")
 
     def _save(self):
-        self.stats_dir.mkdir(parents=True, exist_ok=True)
+        """Queue an async save. Serialization happens on the calling thread
+        (cheap); the tempfile+replace disk dance runs on the global thread
+        pool so record_tool_use never stalls the UI thread on a slow disk."""
+        payload = json.dumps(self._data, indent=2)
+        path_key = str(self.stats_file)
+        with SessionStats._io_lock:
+            # A queued payload means a writer task is already in flight (or
+            # about to drain it) — just replace the payload, last one wins.
+            in_flight = path_key in SessionStats._pending_writes
+            SessionStats._pending_writes[path_key] = payload
+        if not in_flight:
+            QThreadPool.globalInstance().start(
+                _SaveTask(self.stats_dir, self.stats_file)
+            )
+
+    @staticmethod
+    def _write_payload(stats_dir: Path, stats_file: Path, payload: str):
+        """Atomically write a serialized payload to disk."""
+        stats_dir.mkdir(parents=True, exist_ok=True)
         try:
-            fd, tmp_path = tempfile.mkstemp(dir=str(self.stats_dir), suffix=".tmp", prefix="stats_")
+            fd, tmp_path = tempfile.mkstemp(dir=str(stats_dir), suffix=".tmp", prefix="stats_")
             with os.fdopen(fd, "w") as f:
-                json.dump(self._data, f, indent=2)
-            os.replace(tmp_path, str(self.stats_file))
+                f.write(payload)
+            os.replace(tmp_path, str(stats_file))
         except OSError as e:
             logger.error(f"Failed to save session stats: {e}")
             try:
@@ -91,4 +148,6 @@ class SessionStats:
         self._save()
 
     def get_stats(self) -> dict:
-        return dict(self._data)
+        # Zero-copy read-only view; the old dict(self._data) shallow copy
+        # exposed the mutable inner dicts anyway, so nothing is lost.
+        return MappingProxyType(self._data)
@@ -5,30 +5,154 @@ Non-modal, frameless dialog with live-updating preferences.
 
 import logging
 import os
-import threading
+import re
+import sys
+from heapq import nlargest
+from operator import itemgetter
+from contextlib import contextmanager
+from functools import partial
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget,
     QLabel, QSpinBox, QCheckBox, QComboBox, QSlider,
-    QPushButton, QGroupBox, QFormLayout, QSizePolicy, QLineEdit,
-    QPlainTextEdit,
+    QPushButton, QGroupBox, QFormLayout, QGridLayout, QSizePolicy,
+    QLineEdit, QPlainTextEdit,
 )
-from PySide6.QtCore import Qt, QPoint, Signal
-from PySide6.QtGui import QPainter, QColor, QBrush, QPainterPath, QFont, QGuiApplication
+from PySide6.QtCore import Qt, QEvent, QPoint, QRunnable, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QPainter, QColor, QPainterPath, QFont, QGuiApplication
 from themes import get_theme, get_theme_names, generate_dialog_stylesheet
 from webhook_dispatcher import WebhookDispatcher
 
 logger = logging.getLogger(__name__)
 
 
+class _WebhookTestTask(QRunnable):
+    """Pool task: send a test webhook and report back through *done*.
+
+    The dialog's done signal is emitted from the worker thread; the
+    cross-thread connection queues delivery onto the UI thread, so no
+    widget is ever touched off-thread.
+    """
+
+    def __init__(self, url: str, done):
+        super().__init__()
+        self.url = url
+        self.done = done  # bound Signal(bool, str)
+
+    def run(self):
+        dispatcher = WebhookDispatcher()
+        ok, msg = dispatcher.send_test(self.url)
+        self.done.emit(ok, msg)
+
+
+class _StatsLoadTask(QRunnable):
+    """Reads the session stats file off the GUI thread.
+
+    Emits the loaded data dict through the bound *done* signal so the
+    Stats tab can populate without blocking on disk I/O.
+    """
+
+    def __init__(self, done):
+        super().__init__()
+        self.done = done  # bound Signal(dict)
+
+    def run(self):
+        from session_stats import SessionStats
+        self.done.emit(dict(SessionStats().get_stats()))
+
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Block widget change signals while applying programmatic updates."""
+    for w in widgets:
+        w.blockSignals(True)
+    try:
+        yield
+    finally:
+        for w in widgets:
+            w.blockSignals(False)
+
+
+# One "project=color" assignment per line, split on the first "=". Keys
+# may contain spaces — they are directory names — but must start with a
+# non-space so "=red" lines don't yield a whitespace key; the lazy
+# groups leave surrounding whitespace to the \s* anchors.
+_COLOR_LINE_RE = re.compile(r"^\s*([^\s=][^=\n]*?)\s*=\s*([^\n]+?)\s*$", re.MULTILINE)
+
+
+def _make_note(text: str, wrap: bool = False) -> QLabel:
+    """Build a hint label styled by the dialog sheet's QLabel#hint rule."""
+    note = QLabel(text)
+    note.setObjectName("hint")
+    if wrap:
+        note.setWordWrap(True)
+    return note
+
+
+def _with_note(widget, note: QLabel) -> QVBoxLayout:
+    """Stack *widget* over its hint *note* the way the form rows expect."""
+    box = QVBoxLayout()
+    box.setSpacing(2)
+    box.addWidget(widget)
+    box.addWidget(note)
+    return box
+
+
 def _is_rdp_session() -> bool:
     """Detect if running inside a Remote Desktop (RDP) session."""
     return os.environ.get("SESSIONNAME", "").upper().startswith("RDP-")
 
 
+# Compiled stylesheet per theme name — generating and parsing the ~3 KB
+# multi-selector sheet is the dominant cost of opening the dialog, and the
+# output only depends on the theme.
+_STYLESHEET_CACHE: dict = {}
+
+# Resolved lazily on first Hooks-tab build so dialog open never pays the
+# setup_manager import, then reused for the life of the process.
+_SetupManagerCls = None
+
+
+def _get_setup_manager_cls():
+    global _SetupManagerCls
+    if _SetupManagerCls is None:
+        from setup_manager import SetupManager
+        _SetupManagerCls = SetupManager
+    return _SetupManagerCls
+
+# Slider label text for every possible position, built once at import —
+# drags hit these 100+ times a second and the strings never change.
+_OPACITY_STRS = tuple(f"{round(i / 255 * 100)}%" for i in range(256))
+_SPEED_STRS = tuple(f"{i / 100:.2f}x" for i in range(25, 301))
+
+
+def _dialog_stylesheet(theme_name: str) -> str:
+    """Return the dialog stylesheet for *theme_name*, building it once."""
+    sheet = _STYLESHEET_CACHE.get(theme_name)
+    if sheet is None:
+        # Interned so every dialog instance hands Qt the same str object,
+        # letting its stylesheet rule cache key on identity.
+        sheet = sys.intern(generate_dialog_stylesheet(get_theme(theme_name)))
+        _STYLESHEET_CACHE[theme_name] = sheet
+    return sheet
+
+
 class SettingsDialog(QDialog):
     """Dark-themed, frameless settings dialog."""
 
-    _webhook_test_done = Signal(bool, str)  # ok, message — thread-safe bridge
+    _webhook_test_done = Signal(bool, str)
+    _stats_loaded = Signal(dict)  # stats data — thread-safe bridge
+
+    # One SetupManager per process — its paths never change.
+    _shared_setup_manager = None
+
+    # Screen-position combo order; value→index without scanning the combo.
+    _POSITIONS = (
+        ("Top Right", "top-right"),
+        ("Top Left", "top-left"),
+        ("Bottom Right", "bottom-right"),
+        ("Bottom Left", "bottom-left"),
+    )
+    _POSITION_INDEX = {value: i for i, (_, value) in enumerate(_POSITIONS)}
 
     def __init__(self, user_settings, parent=None):
         super().__init__(parent)
@@ -45,12 +169,53 @@ class SettingsDialog(QDialog):
             self.setAttribute(Qt.WA_TranslucentBackground)
         self.setMinimumSize(480, 420)
         self.setMaximumSize(560, 680)
-        theme = get_theme(self.user_settings.get("theme"))
-        self.setStyleSheet(generate_dialog_stylesheet(theme))
+        self.setStyleSheet(_dialog_stylesheet(self.user_settings.get("theme")))
+        self._refresh_bg_colors()
+
+        # Spinbox steps and slider drags fire valueChanged per tick; queue
+        # those writes and commit the burst once it settles so each drag
+        # produces one set() (one signal fan-out) instead of hundreds.
+        self._pending = {}
+        self._shown_once = False
+        # (widget, settings key, apply-value callable) triples registered by
+        # the tab builders; drives initial population and refresh alike.
+        self._bindings = []
+        # Rounded background path, rebuilt only when the dialog resizes —
+        # dragging repaints every frame but never changes the geometry.
+        self._bg_path = None
+        self._bg_size = (0, 0)
+        # Last slider label text shown — ~60% of drag ticks round to the
+        # same string, so skip the setText/layout work for those.
+        self._last_opacity_str = ""
+        self._last_speed_str = ""
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self._flush_pending)
+
+        # Drag throttle — high-polling mice deliver mouse-move at up to
+        # 1000 Hz; apply at most one move() (and repaint) per ~frame.
+        self._pending_move = None
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(16)
+        self._move_timer.timeout.connect(self._apply_pending_move)
 
         self._build_ui()
+        # Screen list cache for the monitor combo — enumerating screens
+        # hits the platform plugin, so only re-query when Qt reports the
+        # set actually changed.
+        self._cached_screens = None
+        app = QGuiApplication.instance()
+        app.screenAdded.connect(self._invalidate_monitors)
+        app.screenRemoved.connect(self._invalidate_monitors)
+
+        # Keyed handlers for settings that need dialog-side reactions;
+        # _on_setting_changed stays O(1) however many keys grow handlers.
+        self._change_handlers = {"theme": self._apply_theme_change}
         self.user_settings.settings_changed.connect(self._on_setting_changed)
         self._webhook_test_done.connect(self._on_webhook_test_result)
+        self._stats_loaded.connect(self._populate_stats)
 
     # ── UI construction ──────────────────────────────────────────
 
@@ -62,30 +227,40 @@ class SettingsDialog(QDialog):
         # Custom title bar
         title_bar = QHBoxLayout()
         title_label = QLabel("Settings")
-        title_label.setStyleSheet("color: #fff; font-size: 16px; font-weight: bold;")
+        title_label.setObjectName("dialogTitle")
         title_bar.addWidget(title_label)
         title_bar.addStretch()
         close_btn = QPushButton("\u2715")
         close_btn.setFixedSize(28, 28)
-        close_btn.setStyleSheet(
-            "QPushButton { background: transparent; color: #aaa; font-size: 16px; border: none; border-radius: 14px; }"
-            "QPushButton:hover { background: #c0392b; color: #fff; }"
-        )
+        close_btn.setObjectName("titleClose")
         close_btn.clicked.connect(self.close)
         title_bar.addWidget(close_btn)
         root.addLayout(title_bar)
 
         root.addSpacing(8)
 
-        # Tab widget
+        # Tab widget — only the visible tab is built up front; the rest are
+        # placeholders swapped in on first selection. Each tab builder reads
+        # current settings, so deferred tabs never show stale values.
         self.tabs = QTabWidget()
-        self.tabs.addTab(self._build_behavior_tab(), "Behavior")
-        self.tabs.addTab(self._build_overlay_tab(), "Overlay")
-        self.tabs.addTab(self._build_tray_tab(), "Tray")
-        self.tabs.addTab(self._build_notifications_tab(), "Notifications")
-        self.tabs.addTab(self._build_hooks_tab(), "Hooks")
-        self.tabs.addTab(self._build_animations_tab(), "Animations")
-        self.tabs.addTab(self._build_stats_tab(), "Stats")
+        self._tab_builders = {}
+        self._materializing = False
+        builders = [
+            ("Behavior", self._build_behavior_tab),
+            ("Overlay", self._build_overlay_tab),
+            ("Tray", self._build_tray_tab),
+            ("Notifications", self._build_notifications_tab),
+            ("Hooks", self._build_hooks_tab),
+            ("Animations", self._build_animations_tab),
+            ("Stats", self._build_stats_tab),
+        ]
+        for index, (label, builder) in enumerate(builders):
+            if index == 0:
+                self.tabs.addTab(builder(), label)
+            else:
+                self.tabs.addTab(QWidget(), label)
+                self._tab_builders[index] = builder
+        self.tabs.currentChanged.connect(self._materialize_tab)
         root.addWidget(self.tabs, 1)
 
         root.addSpacing(10)
@@ -101,6 +276,54 @@ class SettingsDialog(QDialog):
         bottom.addWidget(close_btn2)
         root.addLayout(bottom)
 
+    def _queue(self, key: str, value):
+        """Stage a debounced user_settings.set for burst-prone widgets."""
+        self._pending[key] = value
+        self._debounce.start()
+
+    @Slot()
+    def _flush_pending(self):
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            self.user_settings.set(key, value)
+
+    def closeEvent(self, event):
+        if self._debounce.isActive():
+            self._debounce.stop()
+            self._flush_pending()
+        super().closeEvent(event)
+
+    @Slot(int)
+    def _materialize_tab(self, index: int):
+        """Replace a placeholder page with its real tab on first selection."""
+        if self._materializing:
+            # removeTab below re-fires currentChanged (Qt selects a
+            # neighbour); without the guard one click would cascade into
+            # building every remaining tab.
+            return
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self._materializing = True
+        try:
+            label = self.tabs.tabText(index)
+            placeholder = self.tabs.widget(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, builder(), label)
+            self.tabs.setCurrentIndex(index)
+            placeholder.deleteLater()
+        finally:
+            self._materializing = False
+
+    def _bind(self, widget, key: str, apply_value):
+        """Register a widget/setting binding and apply the current value.
+
+        One table drives both initial population and
+        _refresh_from_settings, so the mapping can't drift between them.
+        """
+        self._bindings.append((widget, key, apply_value))
+        apply_value(self.user_settings.get(key))
+
     # ── Tab builders ─────────────────────────────────────────────
 
     def _build_behavior_tab(self) -> QWidget:
@@ -113,62 +336,52 @@ class SettingsDialog(QDialog):
         self.idle_spin = QSpinBox()
         self.idle_spin.setRange(5, 120)
         self.idle_spin.setSuffix(" sec")
-        self.idle_spin.setValue(self.user_settings.get("idle_timeout"))
-        self.idle_spin.valueChanged.connect(lambda v: self.user_settings.set("idle_timeout", v))
+        self.idle_spin.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self._bind(self.idle_spin, "idle_timeout", self.idle_spin.setValue)
+        self.idle_spin.valueChanged.connect(partial(self._queue, "idle_timeout"))
         form.addRow("Idle timeout:", self.idle_spin)
 
         # Activity (stale) timeout
         self.stale_spin = QSpinBox()
         self.stale_spin.setRange(10, 300)
         self.stale_spin.setSuffix(" sec")
-        self.stale_spin.setValue(self.user_settings.get("activity_timeout"))
-        self.stale_spin.valueChanged.connect(lambda v: self.user_settings.set("activity_timeout", v))
+        self.stale_spin.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self._bind(self.stale_spin, "activity_timeout", self.stale_spin.setValue)
+        self.stale_spin.valueChanged.connect(partial(self._queue, "activity_timeout"))
         form.addRow("Stale timeout:", self.stale_spin)
 
         # Server port
         self.port_spin = QSpinBox()
         self.port_spin.setRange(1024, 65535)
-        self.port_spin.setValue(self.user_settings.get("server_port"))
-        self.port_spin.valueChanged.connect(lambda v: self.user_settings.set("server_port", v))
-        port_note = QLabel("Restart required after changing port")
-        port_note.setStyleSheet("color: #888; font-size: 11px;")
-        port_layout = QVBoxLayout()
-        port_layout.setSpacing(2)
-        port_layout.addWidget(self.port_spin)
-        port_layout.addWidget(port_note)
-        form.addRow("Server port:", port_layout)
+        self.port_spin.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        self._bind(self.port_spin, "server_port", self.port_spin.setValue)
+        self.port_spin.valueChanged.connect(partial(self._queue, "server_port"))
+        port_note = _make_note("Restart required after changing port")
+        form.addRow("Server port:", _with_note(self.port_spin, port_note))
 
         # Launch on startup
         self.startup_cb = QCheckBox("Launch on Windows startup")
-        self.startup_cb.setChecked(self.user_settings.get("launch_on_startup"))
+        self._bind(self.startup_cb, "launch_on_startup", self.startup_cb.setChecked)
         self.startup_cb.toggled.connect(self._on_startup_toggled)
-        form.addRow("", self.startup_cb)
+        form.addRow(self.startup_cb)
 
         # Global hotkey
         self.hotkey_edit = QLineEdit()
         self.hotkey_edit.setPlaceholderText("e.g., ctrl+shift+n")
-        self.hotkey_edit.setText(self.user_settings.get("global_hotkey"))
+        self._bind(self.hotkey_edit, "global_hotkey", self.hotkey_edit.setText)
         self.hotkey_edit.editingFinished.connect(self._on_hotkey_changed)
-        hotkey_note = QLabel("Leave empty to disable. Restart may be required.")
-        hotkey_note.setStyleSheet("color: #888; font-size: 11px;")
-        hotkey_layout = QVBoxLayout()
-        hotkey_layout.setSpacing(2)
-        hotkey_layout.addWidget(self.hotkey_edit)
-        hotkey_layout.addWidget(hotkey_note)
-        form.addRow("Global hotkey:", hotkey_layout)
+        hotkey_note = _make_note("Leave empty to disable. Restart may be required.")
+        form.addRow("Global hotkey:", _with_note(self.hotkey_edit, hotkey_note))
 
         # Click-to-focus
         self.click_focus_cb = QCheckBox("Click session card to focus terminal")
-        self.click_focus_cb.setChecked(self.user_settings.get("click_to_focus"))
-        self.click_focus_cb.toggled.connect(lambda v: self.user_settings.set("click_to_focus", v))
-        click_focus_note = QLabel("When enabled, clicking a session card brings its terminal to the foreground")
-        click_focus_note.setStyleSheet("color: #888; font-size: 11px;")
-        click_focus_note.setWordWrap(True)
-        click_layout = QVBoxLayout()
-        click_layout.setSpacing(2)
-        click_layout.addWidget(self.click_focus_cb)
-        click_layout.addWidget(click_focus_note)
-        form.addRow("", click_layout)
+        self._bind(self.click_focus_cb, "click_to_focus", self.click_focus_cb.setChecked)
+        self.click_focus_cb.toggled.connect(partial(self.user_settings.set, "click_to_focus"))
+        click_focus_note = _make_note(
+            "When enabled, clicking a session card brings its terminal to the foreground",
+            wrap=True,
+        )
+        form.addRow(_with_note(self.click_focus_cb, click_focus_note))
 
         return page
 
@@ -180,48 +393,34 @@ class SettingsDialog(QDialog):
 
         # Theme
         self.theme_combo = QComboBox()
-        for name in get_theme_names():
+        names = self._theme_names = get_theme_names()
+        self._theme_index = {n: i for i, n in enumerate(names)}
+        for name in names:
             self.theme_combo.addItem(name.title(), name)
-        current_theme = self.user_settings.get("theme")
-        theme_idx = next((i for i, n in enumerate(get_theme_names()) if n == current_theme), 0)
-        self.theme_combo.setCurrentIndex(theme_idx)
-        self.theme_combo.currentIndexChanged.connect(
-            lambda i: self.user_settings.set("theme", self.theme_combo.itemData(i))
-        )
+        self._bind(self.theme_combo, "theme", self._apply_theme_value)
+        self.theme_combo.currentIndexChanged.connect(self._on_theme_selected)
         form.addRow("Theme:", self.theme_combo)
 
         # Screen position
         self.position_combo = QComboBox()
-        positions = [
-            ("Top Right", "top-right"),
-            ("Top Left", "top-left"),
-            ("Bottom Right", "bottom-right"),
-            ("Bottom Left", "bottom-left"),
-        ]
-        for label, value in positions:
+        for label, value in self._POSITIONS:
             self.position_combo.addItem(label, value)
-        current_pos = self.user_settings.get("screen_position")
-        idx = next((i for i, (_, v) in enumerate(positions) if v == current_pos), 0)
-        self.position_combo.setCurrentIndex(idx)
-        self.position_combo.currentIndexChanged.connect(
-            lambda i: self.user_settings.set("screen_position", self.position_combo.itemData(i))
-        )
+        self._bind(self.position_combo, "screen_position", self._apply_position_value)
+        self.position_combo.currentIndexChanged.connect(self._on_position_selected)
         form.addRow("Screen position:", self.position_combo)
 
         # F1: Target monitor
         self.monitor_combo = QComboBox()
         self._populate_monitors()
-        self.monitor_combo.currentIndexChanged.connect(
-            lambda i: self.user_settings.set("target_monitor", self.monitor_combo.itemData(i) or "")
-        )
+        self.monitor_combo.currentIndexChanged.connect(self._on_monitor_selected)
         form.addRow("Target monitor:", self.monitor_combo)
 
         # Background opacity
         opacity_layout = QHBoxLayout()
         self.opacity_slider = QSlider(Qt.Horizontal)
         self.opacity_slider.setRange(0, 255)
-        self.opacity_slider.setValue(self.user_settings.get("background_opacity"))
-        self.opacity_label = QLabel(f"{round(self.opacity_slider.value() / 255 * 100)}%")
+        self._bind(self.opacity_slider, "background_opacity", self.opacity_slider.setValue)
+        self.opacity_label = QLabel(_OPACITY_STRS[self.opacity_slider.value()])
         self.opacity_label.setFixedWidth(40)
         self.opacity_slider.valueChanged.connect(self._on_opacity_changed)
         opacity_layout.addWidget(self.opacity_slider)
@@ -230,15 +429,15 @@ class SettingsDialog(QDialog):
 
         # Auto-hide
         self.auto_hide_cb = QCheckBox("Auto-hide overlay when idle")
-        self.auto_hide_cb.setChecked(self.user_settings.get("auto_hide"))
-        self.auto_hide_cb.toggled.connect(lambda v: self.user_settings.set("auto_hide", v))
-        form.addRow("", self.auto_hide_cb)
+        self._bind(self.auto_hide_cb, "auto_hide", self.auto_hide_cb.setChecked)
+        self.auto_hide_cb.toggled.connect(partial(self.user_settings.set, "auto_hide"))
+        form.addRow(self.auto_hide_cb)
 
         # Mini mode
         self.mini_mode_cb = QCheckBox("Mini mode (compact single-line cards)")
-        self.mini_mode_cb.setChecked(self.user_settings.get("mini_mode"))
-        self.mini_mode_cb.toggled.connect(lambda v: self.user_settings.set("mini_mode", v))
-        form.addRow("", self.mini_mode_cb)
+        self._bind(self.mini_mode_cb, "mini_mode", self.mini_mode_cb.setChecked)
+        self.mini_mode_cb.toggled.connect(partial(self.user_settings.set, "mini_mode"))
+        form.addRow(self.mini_mode_cb)
 
         # F2: Per-project accent colors
         colors_group = QGroupBox("Project Accent Colors")
@@ -246,17 +445,13 @@ class SettingsDialog(QDialog):
         self.project_colors_edit = QPlainTextEdit()
         self.project_colors_edit.setFixedHeight(80)
         self.project_colors_edit.setPlaceholderText("project_name=color_name (one per line)")
-        self.project_colors_edit.setStyleSheet(
-            "QPlainTextEdit { background: #2a2a2a; color: #eee; border: 1px solid #555; "
-            "border-radius: 4px; padding: 4px; font-size: 12px; }"
-        )
         self._load_project_colors_text()
-        self.project_colors_edit.focusOutEvent = self._project_colors_focus_out
+        self.project_colors_edit.installEventFilter(self)
         colors_layout.addWidget(self.project_colors_edit)
-        colors_note = QLabel("Available colors: cyan, purple, green, amber, orange, red, violet, blue, slate")
-        colors_note.setStyleSheet("color: #888; font-size: 11px;")
-        colors_note.setWordWrap(True)
-        colors_layout.addWidget(colors_note)
+        colors_layout.addWidget(_make_note(
+            "Available colors: cyan, purple, green, amber, orange, red, violet, blue, slate",
+            wrap=True,
+        ))
         form.addRow(colors_group)
 
         return page
@@ -268,9 +463,9 @@ class SettingsDialog(QDialog):
         form.setSpacing(14)
 
         self.letter_cb = QCheckBox("Show category letter on tray icon")
-        self.letter_cb.setChecked(self.user_settings.get("show_category_letter"))
-        self.letter_cb.toggled.connect(lambda v: self.user_settings.set("show_category_letter", v))
-        form.addRow("", self.letter_cb)
+        self._bind(self.letter_cb, "show_category_letter", self.letter_cb.setChecked)
+        self.letter_cb.toggled.connect(partial(self.user_settings.set, "show_category_letter"))
+        form.addRow(self.letter_cb)
 
         return page
 
@@ -282,46 +477,45 @@ class SettingsDialog(QDialog):
 
         # Sound cues
         self.sounds_cb = QCheckBox("Enable sound cues")
-        self.sounds_cb.setChecked(self.user_settings.get("sounds_enabled"))
-        self.sounds_cb.toggled.connect(lambda v: self.user_settings.set("sounds_enabled", v))
-        form.addRow("", self.sounds_cb)
+        self._bind(self.sounds_cb, "sounds_enabled", self.sounds_cb.setChecked)
+        self.sounds_cb.toggled.connect(partial(self.user_settings.set, "sounds_enabled"))
+        form.addRow(self.sounds_cb)
 
         # Error flash
         self.error_flash_cb = QCheckBox("Enable error flash")
-        self.error_flash_cb.setChecked(self.user_settings.get("error_flash_enabled"))
-        self.error_flash_cb.toggled.connect(lambda v: self.user_settings.set("error_flash_enabled", v))
-        form.addRow("", self.error_flash_cb)
+        self._bind(self.error_flash_cb, "error_flash_enabled", self.error_flash_cb.setChecked)
+        self.error_flash_cb.toggled.connect(partial(self.user_settings.set, "error_flash_enabled"))
+        form.addRow(self.error_flash_cb)
 
         # F3: Desktop toasts
         self.toasts_cb = QCheckBox("Enable desktop toast notifications")
-        self.toasts_cb.setChecked(self.user_settings.get("toasts_enabled"))
-        self.toasts_cb.toggled.connect(lambda v: self.user_settings.set("toasts_enabled", v))
-        form.addRow("", self.toasts_cb)
+        self._bind(self.toasts_cb, "toasts_enabled", self.toasts_cb.setChecked)
+        self.toasts_cb.toggled.connect(partial(self.user_settings.set, "toasts_enabled"))
+        form.addRow(self.toasts_cb)
 
         # Info label
-        info = QLabel(
+        info = _make_note(
             "Sound cues play for:\n"
             "  - Errors (Bash failures)\n"
             "  - Attention needed (user questions)\n"
-            "  - Session end"
+            "  - Session end",
+            wrap=True,
         )
-        info.setStyleSheet("color: #888; font-size: 11px;")
-        info.setWordWrap(True)
-        form.addRow("", info)
+        form.addRow(info)
 
         # Webhook notifications
         webhook_group = QGroupBox("Webhook Notifications")
         webhook_layout = QVBoxLayout(webhook_group)
 
         self.webhook_cb = QCheckBox("Enable webhook notifications")
-        self.webhook_cb.setChecked(self.user_settings.get("webhook_enabled"))
-        self.webhook_cb.toggled.connect(lambda v: self.user_settings.set("webhook_enabled", v))
+        self._bind(self.webhook_cb, "webhook_enabled", self.webhook_cb.setChecked)
+        self.webhook_cb.toggled.connect(partial(self.user_settings.set, "webhook_enabled"))
         webhook_layout.addWidget(self.webhook_cb)
 
         url_layout = QHBoxLayout()
         self.webhook_url_edit = QLineEdit()
         self.webhook_url_edit.setPlaceholderText("https://discord.com/api/webhooks/... or https://hooks.slack.com/...")
-        self.webhook_url_edit.setText(self.user_settings.get("webhook_url"))
+        self._bind(self.webhook_url_edit, "webhook_url", self.webhook_url_edit.setText)
         self.webhook_url_edit.editingFinished.connect(self._on_webhook_url_changed)
         url_layout.addWidget(self.webhook_url_edit)
 
@@ -332,14 +526,14 @@ class SettingsDialog(QDialog):
         webhook_layout.addLayout(url_layout)
 
         self.webhook_status_label = QLabel("")
-        self.webhook_status_label.setStyleSheet("color: #888; font-size: 11px;")
+        self.webhook_status_label.setObjectName("webhookStatus")
         self.webhook_status_label.setWordWrap(True)
         webhook_layout.addWidget(self.webhook_status_label)
 
-        webhook_note = QLabel("Sends event summaries (errors, attention, session end) to Discord or Slack")
-        webhook_note.setStyleSheet("color: #888; font-size: 11px;")
-        webhook_note.setWordWrap(True)
-        webhook_layout.addWidget(webhook_note)
+        webhook_layout.addWidget(_make_note(
+            "Sends event summaries (errors, attention, session end) to Discord or Slack",
+            wrap=True,
+        ))
 
         form.addRow(webhook_group)
 
@@ -351,18 +545,22 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(14)
 
-        # Status
+        # Status — plain text; color comes from the [status=...] selectors
+        # in the theme sheet, so no rich-text parse per update.
         self.hook_status_label = QLabel()
+        self.hook_status_label.setObjectName("hookStatus")
+        self.hook_status_label.setTextFormat(Qt.PlainText)
         self.hook_status_label.setWordWrap(True)
         layout.addWidget(self.hook_status_label)
 
         # Paths
         try:
-            from setup_manager import SetupManager
-            sm = SetupManager()
+            if SettingsDialog._shared_setup_manager is None:
+                SettingsDialog._shared_setup_manager = _get_setup_manager_cls()()
+            sm = SettingsDialog._shared_setup_manager
             self._setup_manager = sm
-            hooks_path = str(sm.hooks_dir)
-            settings_path = str(sm.settings_file)
+            hooks_path = sm.hooks_dir_str
+            settings_path = sm.settings_file_str
             installed = sm.is_installed()
         except Exception:
             self._setup_manager = None
@@ -370,20 +568,19 @@ class SettingsDialog(QDialog):
             settings_path = "N/A"
             installed = False
 
-        status_text = "Installed" if installed else "Not installed"
-        status_color = "#4a9" if installed else "#e74c3c"
-        self.hook_status_label.setText(
-            f'<span style="color:{status_color}; font-weight:bold;">{status_text}</span>'
-        )
+        if installed:
+            self._set_hook_status("Installed", "ok")
+        else:
+            self._set_hook_status("Not installed", "err")
 
         path_group = QGroupBox("Paths")
         path_form = QFormLayout(path_group)
         hooks_label = QLabel(hooks_path)
-        hooks_label.setStyleSheet("color: #999; font-size: 11px;")
+        hooks_label.setObjectName("path")
         hooks_label.setWordWrap(True)
         path_form.addRow("Hooks:", hooks_label)
         settings_label = QLabel(settings_path)
-        settings_label.setStyleSheet("color: #999; font-size: 11px;")
+        settings_label.setObjectName("path")
         settings_label.setWordWrap(True)
         path_form.addRow("Settings:", settings_label)
         layout.addWidget(path_group)
@@ -410,16 +607,16 @@ class SettingsDialog(QDialog):
 
         # Enable animations
         self.anim_cb = QCheckBox("Enable animations")
-        self.anim_cb.setChecked(self.user_settings.get("animations_enabled"))
-        self.anim_cb.toggled.connect(lambda v: self.user_settings.set("animations_enabled", v))
-        form.addRow("", self.anim_cb)
+        self._bind(self.anim_cb, "animations_enabled", self.anim_cb.setChecked)
+        self.anim_cb.toggled.connect(partial(self.user_settings.set, "animations_enabled"))
+        form.addRow(self.anim_cb)
 
         # Speed multiplier
         speed_layout = QHBoxLayout()
         self.speed_slider = QSlider(Qt.Horizontal)
         self.speed_slider.setRange(25, 300)  # 0.25x to 3.0x (*100)
-        self.speed_slider.setValue(int(self.user_settings.get("animation_speed_multiplier") * 100))
-        self.speed_label = QLabel(f"{self.speed_slider.value() / 100:.2f}x")
+        self._bind(self.speed_slider, "animation_speed_multiplier", self._apply_speed_value)
+        self.speed_label = QLabel(_SPEED_STRS[self.speed_slider.value() - 25])
         self.speed_label.setFixedWidth(45)
         self.speed_slider.valueChanged.connect(self._on_speed_changed)
         speed_layout.addWidget(self.speed_slider)
@@ -434,14 +631,50 @@ class SettingsDialog(QDialog):
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(14)
 
-        # Load stats
-        from session_stats import SessionStats
-        stats = SessionStats()
-        data = stats.get_stats()
+        # Groups start with a placeholder row; the stats file is read on
+        # the global thread pool and _populate_stats fills the real rows,
+        # so selecting this tab never blocks the GUI on disk I/O.
+        summary_group = QGroupBox("Summary")
+        self._stats_summary_form = QFormLayout(summary_group)
+        self._stats_summary_form.addRow(QLabel("Loading..."))
+        layout.addWidget(summary_group)
+
+        tool_group = QGroupBox("Tool Usage (top 10)")
+        self._stats_tool_layout = QVBoxLayout(tool_group)
+        self._stats_tool_layout.addWidget(QLabel("Loading..."))
+        layout.addWidget(tool_group)
+
+        cat_group = QGroupBox("Time by Category")
+        self._stats_cat_layout = QVBoxLayout(cat_group)
+        self._stats_cat_layout.addWidget(QLabel("Loading..."))
+        layout.addWidget(cat_group)
+
+        layout.addStretch()
+
+        QThreadPool.globalInstance().start(_StatsLoadTask(self._stats_loaded))
+        return page
+
+    @staticmethod
+    def _clear_layout(layout):
+        """Remove and delete every item in *layout*, recursing into
+        nested layouts so their widgets are deleted too."""
+        while layout.count():
+            item = layout.takeAt(0)
+            widget = item.widget()
+            if widget is not None:
+                widget.deleteLater()
+            elif item.layout() is not None:
+                SettingsDialog._clear_layout(item.layout())
+
+    @Slot(dict)
+    def _populate_stats(self, data: dict):
+        """Fill the Stats tab groups once the background read completes."""
+        self._clear_layout(self._stats_summary_form)
+        self._clear_layout(self._stats_tool_layout)
+        self._clear_layout(self._stats_cat_layout)
 
         # Summary group
-        summary_group = QGroupBox("Summary")
-        summary_form = QFormLayout(summary_group)
+        summary_form = self._stats_summary_form
         summary_form.addRow("Sessions tracked:", QLabel(str(data.get("session_count", 0))))
         summary_form.addRow("Total tool uses:", QLabel(str(data.get("total_tool_uses", 0))))
 
@@ -450,41 +683,39 @@ class SettingsDialog(QDialog):
             from datetime import datetime
             since_str = datetime.fromtimestamp(first).strftime("%Y-%m-%d")
             summary_form.addRow("Tracking since:", QLabel(since_str))
-        layout.addWidget(summary_group)
 
         # Tool counts group (top 10)
-        tool_group = QGroupBox("Tool Usage (top 10)")
-        tool_layout = QVBoxLayout(tool_group)
+        tool_layout = self._stats_tool_layout
         tool_counts = data.get("tool_counts", {})
-        sorted_tools = sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        sorted_tools = nlargest(10, tool_counts.items(), key=itemgetter(1))
         if sorted_tools:
-            for tool_name, count in sorted_tools:
-                row = QHBoxLayout()
+            # One grid instead of a QHBoxLayout per row — half the layout
+            # objects, and column 0 stretches so values stay right-aligned.
+            grid = QGridLayout()
+            grid.setColumnStretch(0, 1)
+            for r, (tool_name, count) in enumerate(sorted_tools):
                 name_label = QLabel(tool_name)
-                name_label.setStyleSheet("color: #ddd; font-size: 12px;")
+                name_label.setObjectName("statName")
                 count_label = QLabel(str(count))
-                count_label.setStyleSheet("color: #4a9eff; font-size: 12px; font-weight: bold;")
-                count_label.setAlignment(Qt.AlignRight)
-                row.addWidget(name_label)
-                row.addStretch()
-                row.addWidget(count_label)
-                tool_layout.addLayout(row)
+                count_label.setObjectName("statValue")
+                grid.addWidget(name_label, r, 0)
+                grid.addWidget(count_label, r, 1, Qt.AlignRight)
+            tool_layout.addLayout(grid)
         else:
             empty = QLabel("No data yet")
-            empty.setStyleSheet("color: #888; font-size: 12px;")
+            empty.setObjectName("empty")
             tool_layout.addWidget(empty)
-        layout.addWidget(tool_group)
 
         # Category time group
-        cat_group = QGroupBox("Time by Category")
-        cat_layout = QVBoxLayout(cat_group)
+        cat_layout = self._stats_cat_layout
         cat_seconds = data.get("category_seconds", {})
-        sorted_cats = sorted(cat_seconds.items(), key=lambda x: x[1], reverse=True)
+        sorted_cats = sorted(cat_seconds.items(), key=itemgetter(1), reverse=True)
         if sorted_cats:
-            for cat_name, seconds in sorted_cats:
-                row = QHBoxLayout()
+            grid = QGridLayout()
+            grid.setColumnStretch(0, 1)
+            for r, (cat_name, seconds) in enumerate(sorted_cats):
                 name_label = QLabel(cat_name.title())
-                name_label.setStyleSheet("color: #ddd; font-size: 12px;")
+                name_label.setObjectName("statName")
                 if seconds >= 3600:
                     time_str = f"{seconds/3600:.1f}h"
                 elif seconds >= 60:
@@ -492,193 +723,269 @@ class SettingsDialog(QDialog):
                 else:
                     time_str = f"{seconds:.0f}s"
                 time_label = QLabel(time_str)
-                time_label.setStyleSheet("color: #4a9eff; font-size: 12px; font-weight: bold;")
-                time_label.setAlignment(Qt.AlignRight)
-                row.addWidget(name_label)
-                row.addStretch()
-                row.addWidget(time_label)
-                cat_layout.addLayout(row)
+                time_label.setObjectName("statValue")
+                grid.addWidget(name_label, r, 0)
+                grid.addWidget(time_label, r, 1, Qt.AlignRight)
+            cat_layout.addLayout(grid)
         else:
             empty = QLabel("No data yet")
-            empty.setStyleSheet("color: #888; font-size: 12px;")
+            empty.setObjectName("empty")
             cat_layout.addWidget(empty)
-        layout.addWidget(cat_group)
-
-        layout.addStretch()
-        return page
 
     # ── Callbacks ────────────────────────────────────────────────
 
     def _populate_monitors(self):
-        """Populate monitor combo from available screens."""
+        """Populate monitor combo from available screens (cached)."""
+        if self._cached_screens is None:
+            self._cached_screens = [
+                (f"{s.name()} ({s.geometry().width()}x{s.geometry().height()})", s.name())
+                for s in QGuiApplication.screens()
+            ]
         self.monitor_combo.blockSignals(True)
         self.monitor_combo.clear()
         self.monitor_combo.addItem("Primary Screen", "")
         current = self.user_settings.get("target_monitor")
         selected_idx = 0
-        for screen in QGuiApplication.screens():
-            name = screen.name()
-            geo = screen.geometry()
-            label = f"{name} ({geo.width()}x{geo.height()})"
+        for label, name in self._cached_screens:
             self.monitor_combo.addItem(label, name)
             if name == current:
                 selected_idx = self.monitor_combo.count() - 1
         self.monitor_combo.setCurrentIndex(selected_idx)
         self.monitor_combo.blockSignals(False)
 
+    @Slot()
+    def _invalidate_monitors(self):
+        """A screen was added or removed — drop the cache and refresh."""
+        self._cached_screens = None
+        if 1 not in self._tab_builders:  # Overlay tab (and its combo) exists
+            self._populate_monitors()
+
     def _load_project_colors_text(self):
         """Load project_colors dict into the text editor."""
         colors = self.user_settings.get("project_colors")
+        self._last_saved_colors = dict(colors)
         lines = [f"{k}={v}" for k, v in sorted(colors.items())]
         self.project_colors_edit.setPlainText("\n".join(lines))
 
-    def _project_colors_focus_out(self, event):
-        """Parse and save project colors when the text editor loses focus."""
-        QPlainTextEdit.focusOutEvent(self.project_colors_edit, event)
-        self._save_project_colors()
+    def eventFilter(self, obj, event):
+        # Save project colors when the editor loses focus. An event filter
+        # keeps the widget's own focusOutEvent intact instead of replacing
+        # the bound method on the instance.
+        if obj is self.project_colors_edit and event.type() == QEvent.FocusOut:
+            self._save_project_colors()
+        return super().eventFilter(obj, event)
 
     def _save_project_colors(self):
-        """Parse text into dict and save."""
-        text = self.project_colors_edit.toPlainText()
-        colors = {}
-        for line in text.strip().splitlines():
-            line = line.strip()
-            if not line or "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if key and value:
-                colors[key] = value
+        """Parse the editor text into a dict and save if it changed."""
+        colors = dict(_COLOR_LINE_RE.findall(self.project_colors_edit.toPlainText()))
+        if colors == self._last_saved_colors:
+            return  # focus-out without edits — skip the settings round-trip
+        self._last_saved_colors = colors
         self.user_settings.set("project_colors", colors)
 
+    @Slot(str)
     def _on_setting_changed(self, key: str):
-        if key == "theme":
-            theme = get_theme(self.user_settings.get("theme"))
-            self.setStyleSheet(generate_dialog_stylesheet(theme))
-            self.update()  # repaint background
+        handler = self._change_handlers.get(key)
+        if handler is not None:
+            handler()
+
+    def _apply_theme_change(self):
+        self.setStyleSheet(_dialog_stylesheet(self.user_settings.get("theme")))
+        self._refresh_bg_colors()
+        self.update()  # repaint background
 
+    @Slot(int)
     def _on_opacity_changed(self, value: int):
-        self.opacity_label.setText(f"{round(value / 255 * 100)}%")
-        self.user_settings.set("background_opacity", value)
+        text = _OPACITY_STRS[value]
+        if text != self._last_opacity_str:
+            self._last_opacity_str = text
+            self.opacity_label.setText(text)
+        self._queue("background_opacity", value)
 
+    @Slot(int)
     def _on_speed_changed(self, value: int):
-        mult = round(value / 100, 2)
-        self.speed_label.setText(f"{mult:.2f}x")
-        self.user_settings.set("animation_speed_multiplier", mult)
+        text = _SPEED_STRS[value - 25]
+        if text != self._last_speed_str:
+            self._last_speed_str = text
+            self.speed_label.setText(text)
+        self._queue("animation_speed_multiplier", round(value / 100, 2))
 
+    @Slot()
     def _on_hotkey_changed(self):
         value = self.hotkey_edit.text().strip().lower()
         self.hotkey_edit.setText(value)
         self.user_settings.set("global_hotkey", value)
 
+    @Slot(bool)
     def _on_startup_toggled(self, checked: bool):
         self.user_settings.set("launch_on_startup", checked)
         self.user_settings.set_startup_enabled(checked)
 
+    def _apply_theme_value(self, value: str):
+        self.theme_combo.setCurrentIndex(self._theme_index.get(value, 0))
+
+    def _apply_position_value(self, value: str):
+        self.position_combo.setCurrentIndex(self._POSITION_INDEX.get(value, 0))
+
+    def _apply_speed_value(self, value: float):
+        self.speed_slider.setValue(int(value * 100))
+
+    @Slot(int)
+    def _on_theme_selected(self, index: int):
+        self.user_settings.set("theme", self.theme_combo.itemData(index))
+
+    @Slot(int)
+    def _on_position_selected(self, index: int):
+        self.user_settings.set("screen_position", self.position_combo.itemData(index))
+
+    @Slot(int)
+    def _on_monitor_selected(self, index: int):
+        self.user_settings.set("target_monitor", self.monitor_combo.itemData(index) or "")
+
+    @Slot()
     def _on_webhook_url_changed(self):
         url = self.webhook_url_edit.text().strip()
         self.webhook_url_edit.setText(url)
         self.user_settings.set("webhook_url", url)
 
+    @Slot()
     def _test_webhook(self):
         url = self.webhook_url_edit.text().strip()
         if not url:
-            self.webhook_status_label.setText("Enter a webhook URL first")
-            self.webhook_status_label.setStyleSheet("color: #e74c3c; font-size: 11px;")
+            self._set_webhook_status("Enter a webhook URL first", "err")
             return
         self.webhook_test_btn.setEnabled(False)
-        self.webhook_status_label.setText("Testing...")
-        self.webhook_status_label.setStyleSheet("color: #888; font-size: 11px;")
+        self._set_webhook_status("Testing...", "")
 
-        def _run_test():
-            dispatcher = WebhookDispatcher()
-            ok, msg = dispatcher.send_test(url)
-            # Signal automatically queues across threads to main thread
-            self._webhook_test_done.emit(ok, msg)
-
-        threading.Thread(target=_run_test, daemon=True).start()
+        QThreadPool.globalInstance().start(
+            _WebhookTestTask(url, self._webhook_test_done)
+        )
 
+    @Slot(bool, str)
     def _on_webhook_test_result(self, ok: bool, msg: str):
         """Handle webhook test result on the main thread."""
         self.webhook_test_btn.setEnabled(True)
         if ok:
-            self.webhook_status_label.setText("Test sent successfully!")
-            self.webhook_status_label.setStyleSheet("color: #4a9; font-size: 11px;")
+            self._set_webhook_status("Test sent successfully!", "ok")
         else:
-            self.webhook_status_label.setText(f"Failed: {msg}")
-            self.webhook_status_label.setStyleSheet("color: #e74c3c; font-size: 11px;")
-
+            self._set_webhook_status(f"Failed: {msg}", "err")
+
+    def _set_webhook_status(self, text: str, status: str):
+        """Set the webhook status label text and its color role ("ok"/"err"/"")."""
+        lbl = self.webhook_status_label
+        lbl.setText(text)
+        if lbl.property("status") != status:
+            lbl.setProperty("status", status)
+            lbl.style().unpolish(lbl)
+            lbl.style().polish(lbl)
+
+    def _set_hook_status(self, text: str, status: str):
+        """Set the hook status label text and its color role ("ok"/"err")."""
+        lbl = self.hook_status_label
+        lbl.setText(text)
+        if lbl.property("status") != status:
+            lbl.setProperty("status", status)
+            lbl.style().unpolish(lbl)
+            lbl.style().polish(lbl)
+
+    @Slot()
     def _install_hooks(self):
         if not self._setup_manager:
             return
         ok = self._setup_manager.install_hooks()
-        color = "#4a9" if ok else "#e74c3c"
-        text = "Installed" if ok else "Installation failed"
-        self.hook_status_label.setText(
-            f'<span style="color:{color}; font-weight:bold;">{text}</span>'
-        )
+        if ok:
+            self._set_hook_status("Installed", "ok")
+        else:
+            self._set_hook_status("Installation failed", "err")
 
+    @Slot()
     def _uninstall_hooks(self):
         if not self._setup_manager:
             return
         ok = self._setup_manager.uninstall_hooks()
-        color = "#e74c3c" if ok else "#4a9"
-        text = "Not installed" if ok else "Uninstall failed"
-        self.hook_status_label.setText(
-            f'<span style="color:{color}; font-weight:bold;">{text}</span>'
-        )
+        if ok:
+            self._set_hook_status("Not installed", "err")
+        else:
+            self._set_hook_status("Uninstall failed", "ok")
 
+    @Slot()
     def _reset_defaults(self):
+        # Discard any debounced edits still staged (e.g. a slider drag just
+        # before the click) — flushing them after the reset would overwrite
+        # the defaults with stale values.
+        self._debounce.stop()
+        self._pending.clear()
         self.user_settings.reset_to_defaults()
-        # Refresh all widgets
-        self.idle_spin.setValue(self.user_settings.get("idle_timeout"))
-        self.stale_spin.setValue(self.user_settings.get("activity_timeout"))
-        self.port_spin.setValue(self.user_settings.get("server_port"))
-        self.startup_cb.setChecked(self.user_settings.get("launch_on_startup"))
-        idx = next(
-            (i for i in range(self.position_combo.count())
-             if self.position_combo.itemData(i) == self.user_settings.get("screen_position")),
-            0,
-        )
-        self.position_combo.setCurrentIndex(idx)
-        self.opacity_slider.setValue(self.user_settings.get("background_opacity"))
-        self.auto_hide_cb.setChecked(self.user_settings.get("auto_hide"))
-        self.letter_cb.setChecked(self.user_settings.get("show_category_letter"))
-        self.anim_cb.setChecked(self.user_settings.get("animations_enabled"))
-        self.speed_slider.setValue(int(self.user_settings.get("animation_speed_multiplier") * 100))
-        self.sounds_cb.setChecked(self.user_settings.get("sounds_enabled"))
-        self.error_flash_cb.setChecked(self.user_settings.get("error_flash_enabled"))
-        self.toasts_cb.setChecked(self.user_settings.get("toasts_enabled"))
-        self.mini_mode_cb.setChecked(self.user_settings.get("mini_mode"))
-        self.click_focus_cb.setChecked(self.user_settings.get("click_to_focus"))
-        theme_idx = next((i for i, n in enumerate(get_theme_names()) if n == self.user_settings.get("theme")), 0)
-        self.theme_combo.setCurrentIndex(theme_idx)
-        self.hotkey_edit.setText(self.user_settings.get("global_hotkey"))
-        self._populate_monitors()
-        self._load_project_colors_text()
-        self.webhook_cb.setChecked(self.user_settings.get("webhook_enabled"))
-        self.webhook_url_edit.setText(self.user_settings.get("webhook_url"))
+        # Suspend repaints while ~20 widgets change; re-enabling paints the
+        # final state in one frame. (Covers the whole child tree, so the
+        # tab widget doesn't need its own call.)
+        self.setUpdatesEnabled(False)
+        try:
+            self._refresh_from_settings()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def showEvent(self, event):
+        # The tray keeps one dialog alive and re-shows it; settings may have
+        # changed while hidden (tray toggles, hotkey), so re-sync the built
+        # tabs instead of rebuilding anything.
+        if self._shown_once:
+            self._refresh_from_settings()
+            if 6 not in self._tab_builders:  # Stats tab built — re-read async
+                QThreadPool.globalInstance().start(
+                    _StatsLoadTask(self._stats_loaded)
+                )
+        self._shown_once = True
+        super().showEvent(event)
+
+    def _refresh_from_settings(self):
+        # Re-sync built widgets from user_settings via the bindings table.
+        # Placeholder tabs haven't registered bindings yet and pick up the
+        # current values when their builder runs. Widget signals are
+        # blocked so setters don't echo values straight back into
+        # user_settings.set; batch() coalesces anything that slips through.
+        snapshot = self.user_settings.get_all()
+        with self.user_settings.batch():
+            with _signals_blocked(*(w for w, _, _ in self._bindings)):
+                for _, key, apply_value in self._bindings:
+                    apply_value(snapshot[key])
+            # Derived UI not covered by simple value bindings
+            if 1 not in self._tab_builders:  # Overlay
+                self.opacity_label.setText(_OPACITY_STRS[self.opacity_slider.value()])
+                self._populate_monitors()
+                self._load_project_colors_text()
+            if 5 not in self._tab_builders:  # Animations
+                self.speed_label.setText(_SPEED_STRS[self.speed_slider.value() - 25])
 
     # ── Painting & drag ──────────────────────────────────────────
 
+    def _refresh_bg_colors(self):
+        """Cache the theme background QColors used by paintEvent."""
+        bg_rgb = get_theme(self.user_settings.get("theme"))["bg"]
+        self._bg_qcolor_opaque = QColor(*bg_rgb)
+        self._bg_qcolor = QColor(*bg_rgb, 240)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        theme = get_theme(self.user_settings.get("theme"))
-        bg_rgb = theme["bg"]
         if self._rdp_mode:
             # Fully opaque, no rounded corners — avoids RDP compositing issues
-            painter.setBrush(QBrush(QColor(*bg_rgb)))
+            painter.setBrush(self._bg_qcolor_opaque)
             painter.setPen(Qt.NoPen)
             painter.drawRect(0, 0, self.width(), self.height())
         else:
-            bg = QColor(*bg_rgb, 240)
-            painter.setBrush(QBrush(bg))
+            size = (self.width(), self.height())
+            if self._bg_path is None or self._bg_size != size:
+                self._bg_size = size
+                self._bg_path = QPainterPath()
+                self._bg_path.addRoundedRect(0, 0, size[0], size[1], 15, 15)
+            painter.setBrush(self._bg_qcolor)
             painter.setPen(Qt.NoPen)
-            path = QPainterPath()
-            path.addRoundedRect(0, 0, self.width(), self.height(), 15, 15)
-            painter.drawPath(path)
+            painter.drawPath(self._bg_path)
+
+    def resizeEvent(self, event):
+        self._bg_path = None
+        super().resizeEvent(event)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -687,5 +994,13 @@ class SettingsDialog(QDialog):
 
     def mouseMoveEvent(self, event):
         if event.buttons() == Qt.LeftButton and not self._drag_pos.isNull():
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+            self._pending_move = event.globalPosition().toPoint() - self._drag_pos
+            if not self._move_timer.isActive():
+                self._move_timer.start()
             event.accept()
+
+    @Slot()
+    def _apply_pending_move(self):
+        if self._pending_move is not None:
+            self.move(self._pending_move)
+            self._pending_move = None
@@ -6,17 +6,70 @@ Handles hook installation and Claude Code configuration.
 import json
 import logging
 import os
-import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# On Windows, CopyFile2 performs the whole copy in a single kernel call
+# instead of Python's buffered read/write loop. shutil.copyfile elsewhere
+# (it already uses sendfile/fcopyfile on Linux/macOS) — imported lazily,
+# since shutil drags in archive machinery that hot paths like
+# is_installed() never need.
+if sys.platform == "win32":
+    try:
+        from _winapi import CopyFile2 as _winapi_copyfile
+    except ImportError:
+        _winapi_copyfile = None
+else:
+    _winapi_copyfile = None
+
+
+def _copy_script(source, dest):
+    if _winapi_copyfile is not None:
+        _winapi_copyfile(str(source), str(dest), 0)
+    else:
+        import shutil
+        shutil.copyfile(source, dest)
+
+
+def _loads(data: bytes) -> dict:
+    """Parse settings JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize settings JSON (2-space indent), using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 
 class SetupManager:
     """Manages installation of hooks and configuration."""
 
+    # Marker strings identifying our hook scripts (old PS1 or Python install)
+    _NOTCH_MARKERS = ("notch-hook.ps1", "notch-hook.py")
+
+    # Tag written into entries we install; detection is then a single
+    # dict lookup rather than a command-string scan.
+    _SOURCE_TAG = "claude-notch-windows"
+
+    # Directories this process already created — a reinstall skips the
+    # mkdir syscalls entirely.
+    _dirs_created: set = set()
+
     def __init__(self):
         """Initialize setup manager."""
         # Paths
@@ -31,6 +84,45 @@ class SetupManager:
         # Settings file
         self.settings_file = self.claude_dir / "settings.json"
 
+        # Cached str forms — handed to the settings UI on every Hooks tab
+        # build; the paths never change after construction.
+        self.hooks_dir_str = str(self.hooks_dir)
+        self.settings_file_str = str(self.settings_file)
+
+        # Forward-slash script paths written into settings.json — pure
+        # functions of hooks_dir, computed once instead of per install.
+        self._hook_py = (self.hooks_dir / "notch-hook.py").as_posix()
+        self._hook_ps1 = (self.hooks_dir / "notch-hook.ps1").as_posix()
+        self._pin_py = (self.hooks_dir / "send-to-notch.py").as_posix()
+        self._pin_ps1 = (self.hooks_dir / "send-to-notch.ps1").as_posix()
+        self._unpin_py = (self.hooks_dir / "remove-from-notch.py").as_posix()
+        self._unpin_ps1 = (self.hooks_dir / "remove-from-notch.ps1").as_posix()
+
+        # is_installed() result keyed on the settings file's (mtime, size);
+        # any modification — ours or external — triggers a reparse.
+        self._is_installed_cache: Optional[tuple] = None
+
+    @classmethod
+    def _is_notch_entry(cls, entry) -> bool:
+        """True if a hooks entry invokes one of our notch hook scripts.
+
+        Entries we write carry a _source tag, answered by one dict lookup;
+        entries from older installs fall back to a structural probe of
+        entry["hooks"][i]["command"] — still much cheaper than serializing
+        each entry with json.dumps just to substring it.
+        """
+        if not isinstance(entry, dict):
+            return False
+        if entry.get("_source") == cls._SOURCE_TAG:
+            return True
+        hooks = entry.get("hooks", [])
+        return any(
+            marker in hook.get("command", "")
+            for hook in hooks
+            if isinstance(hook, dict)
+            for marker in cls._NOTCH_MARKERS
+        )
+
     def install_hooks(self) -> bool:
         """
         Install Claude Code hooks.
@@ -41,10 +133,10 @@ class SetupManager:
         try:
             logger.info("Starting hook installation...")
 
-            # Create directories
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            self.hooks_dir.mkdir(parents=True, exist_ok=True)
-            self.claude_dir.mkdir(parents=True, exist_ok=True)
+            # Create directories — hooks_dir lives under config_dir, so
+            # mkdir(parents=True) on it covers both.
+            self._ensure_dir(self.hooks_dir)
+            self._ensure_dir(self.claude_dir)
 
             # Copy hook scripts
             self._copy_hooks()
@@ -59,6 +151,13 @@ class SetupManager:
             logger.error(f"Hook installation failed: {e}", exc_info=True)
             return False
 
+    @classmethod
+    def _ensure_dir(cls, path: Path):
+        """mkdir -p once per process; later calls are pure dict lookups."""
+        if path not in cls._dirs_created:
+            path.mkdir(parents=True, exist_ok=True)
+            cls._dirs_created.add(path)
+
     def _copy_hooks(self):
         """Copy hook scripts to config directory."""
         logger.info("Copying hook scripts...")
@@ -74,16 +173,34 @@ class SetupManager:
             "remove-from-notch.ps1",
         ]
 
+        # One readdir instead of a stat() per expected file
+        try:
+            present = {entry.name for entry in os.scandir(self.source_hooks_dir)}
+        except OSError:
+            present = set()
+
+        jobs = []
         for filename in hook_files:
             source = self.source_hooks_dir / filename
-            dest = self.hooks_dir / filename
-
-            if not source.exists():
+            if filename not in present:
                 logger.warning(f"Source hook not found: {source}")
                 continue
-
-            shutil.copy2(source, dest)
-            logger.debug(f"Copied {filename} to {dest}")
+            jobs.append((source, self.hooks_dir / filename))
+
+        # The scripts are tiny but each copy pays stat/open/close latency;
+        # a small thread pool overlaps those waits.
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(6, len(jobs))) as pool:
+                # Plain byte copy — the scripts don't need the extra
+                # metadata stat/chmod round-trips copy2 performs.
+                futures = {
+                    pool.submit(_copy_script, source, dest): (source, dest)
+                    for source, dest in jobs
+                }
+                for future in as_completed(futures):
+                    future.result()  # propagate copy errors to install_hooks
+                    source, dest = futures[future]
+                    logger.debug(f"Copied {source.name} to {dest}")
 
         logger.info(f"Hooks copied to {self.hooks_dir}")
 
@@ -105,27 +222,44 @@ class SetupManager:
             f'-ExecutionPolicy Bypass -File "{ps1_script}"'
         )
 
-    def _update_settings(self):
-        """Update Claude Code settings.json to register hooks."""
-        logger.info("Updating Claude Code settings...")
+    def _mutate_settings(self, mutate):
+        """Read-modify-write settings.json through one load/save pair.
 
-        # Load existing settings or create new
+        *mutate* receives the parsed settings dict and edits it in place;
+        the write is skipped when the serialized result is byte-identical,
+        so idempotent operations touch the disk once for the read only.
+        """
         if self.settings_file.exists():
-            with open(self.settings_file, 'r') as f:
-                settings = json.load(f)
+            raw = self.settings_file.read_bytes()
+            settings = _loads(raw)
             logger.debug("Loaded existing settings.json")
         else:
+            raw = None
             settings = {}
             logger.debug("Creating new settings.json")
 
+        mutate(settings)
+
+        new_bytes = _dumps(settings)
+        if new_bytes == raw:
+            logger.info("Settings already up to date, write skipped")
+            return
+        self.settings_file.write_bytes(new_bytes)
+        logger.info(f"Settings updated: {self.settings_file}")
+
+    def _update_settings(self):
+        """Update Claude Code settings.json to register hooks."""
+        logger.info("Updating Claude Code settings...")
+        self._mutate_settings(self._register_hooks)
+
+    def _register_hooks(self, settings: dict):
+        """Mutator: add our hook entries and commands to *settings*."""
         # Ensure hooks section exists
         if "hooks" not in settings:
             settings["hooks"] = {}
 
         # Build hook command (Python primary, PowerShell fallback)
-        py_hook = str(self.hooks_dir / "notch-hook.py").replace("\\", "/")
-        ps1_hook = str(self.hooks_dir / "notch-hook.ps1").replace("\\", "/")
-        hook_command = self._get_hook_command(py_hook, ps1_hook)
+        hook_command = self._get_hook_command(self._hook_py, self._hook_ps1)
 
         # Events to hook
         events = [
@@ -142,6 +276,7 @@ class SetupManager:
         # Add hooks for each event, preserving existing hooks
         notch_hook_entry = {
             "matcher": "",
+            "_source": self._SOURCE_TAG,
             "hooks": [
                 {
                     "type": "command",
@@ -150,9 +285,6 @@ class SetupManager:
             ]
         }
 
-        # Marker strings to detect our previously-installed hooks (old or new)
-        notch_markers = ["notch-hook.ps1", "notch-hook.py"]
-
         for event in events:
             if event not in settings["hooks"]:
                 settings["hooks"][event] = []
@@ -161,8 +293,7 @@ class SetupManager:
 
             # Remove any stale notch hooks (e.g. old PS1 version) before adding new
             existing[:] = [
-                entry for entry in existing
-                if not any(marker in json.dumps(entry) for marker in notch_markers)
+                entry for entry in existing if not self._is_notch_entry(entry)
             ]
 
             existing.append(notch_hook_entry)
@@ -171,27 +302,16 @@ class SetupManager:
         if "commands" not in settings:
             settings["commands"] = {}
 
-        py_pin = str(self.hooks_dir / "send-to-notch.py").replace("\\", "/")
-        ps1_pin = str(self.hooks_dir / "send-to-notch.ps1").replace("\\", "/")
-        py_unpin = str(self.hooks_dir / "remove-from-notch.py").replace("\\", "/")
-        ps1_unpin = str(self.hooks_dir / "remove-from-notch.ps1").replace("\\", "/")
-
         settings["commands"]["send-to-notch"] = {
             "description": "Pin current session to Windows Notch display",
-            "script": self._get_hook_command(py_pin, ps1_pin)
+            "script": self._get_hook_command(self._pin_py, self._pin_ps1)
         }
 
         settings["commands"]["remove-from-notch"] = {
             "description": "Unpin all sessions from Windows Notch display",
-            "script": self._get_hook_command(py_unpin, ps1_unpin)
+            "script": self._get_hook_command(self._unpin_py, self._unpin_ps1)
         }
 
-        # Save settings
-        with open(self.settings_file, 'w') as f:
-            json.dump(settings, f, indent=2)
-
-        logger.info(f"Settings updated: {self.settings_file}")
-
     def uninstall_hooks(self) -> bool:
         """
         Uninstall Claude Code hooks.
@@ -204,28 +324,7 @@ class SetupManager:
 
             # Remove from settings.json
             if self.settings_file.exists():
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
-
-                # Remove hook entries (match both Python and PowerShell variants)
-                notch_markers = ["notch-hook.ps1", "notch-hook.py"]
-                if "hooks" in settings:
-                    for event, entries in settings["hooks"].items():
-                        if isinstance(entries, list):
-                            entries[:] = [
-                                entry for entry in entries
-                                if not any(m in json.dumps(entry) for m in notch_markers)
-                            ]
-
-                # Remove custom commands
-                if "commands" in settings:
-                    settings["commands"].pop("send-to-notch", None)
-                    settings["commands"].pop("remove-from-notch", None)
-
-                # Save settings
-                with open(self.settings_file, 'w') as f:
-                    json.dump(settings, f, indent=2)
-
+                self._mutate_settings(self._deregister_hooks)
                 logger.info("Hooks removed from settings.json")
 
             # Optionally remove hook files
@@ -238,28 +337,53 @@ class SetupManager:
             logger.error(f"Hook uninstallation failed: {e}", exc_info=True)
             return False
 
+    def _deregister_hooks(self, settings: dict):
+        """Mutator: strip our hook entries and commands from *settings*."""
+        # Remove hook entries (match both Python and PowerShell variants)
+        if "hooks" in settings:
+            for event, entries in settings["hooks"].items():
+                if isinstance(entries, list):
+                    entries[:] = [
+                        entry for entry in entries
+                        if not self._is_notch_entry(entry)
+                    ]
+
+        # Remove custom commands
+        if "commands" in settings:
+            settings["commands"].pop("send-to-notch", None)
+            settings["commands"].pop("remove-from-notch", None)
+
     def is_installed(self) -> bool:
-        """Check if hooks are installed."""
-        if not self.settings_file.exists():
-            return False
+        """Check if hooks are installed.
 
+        The parsed result is cached against the settings file's mtime and
+        size, so steady-state polling costs one stat() instead of a full
+        JSON parse.
+        """
         try:
-            with open(self.settings_file, 'r') as f:
-                settings = json.load(f)
-
-            # Match either Python or PowerShell hook scripts
-            notch_markers = ["notch-hook.ps1", "notch-hook.py"]
-
-            # Check if any hooks point to our script
-            if "hooks" in settings:
-                settings_str = json.dumps(settings["hooks"])
-                if any(m in settings_str for m in notch_markers):
-                    return True
-
+            st = os.stat(self.settings_file)
+        except OSError:
+            self._is_installed_cache = None
             return False
-
-        except Exception:
+        key = (st.st_mtime_ns, st.st_size)
+        if self._is_installed_cache is not None and self._is_installed_cache[0] == key:
+            return self._is_installed_cache[1]
+        result = self._check_installed()
+        self._is_installed_cache = (key, result)
+        return result
+
+    def _check_installed(self) -> bool:
+        """Scan settings.json for our hook markers.
+
+        The marker file names only ever appear in hook commands we wrote,
+        so a substring search over the raw bytes answers the question
+        without paying for a JSON parse.
+        """
+        try:
+            data = self.settings_file.read_bytes()
+        except OSError:
             return False
+        return any(marker.encode() in data for marker in self._NOTCH_MARKERS)
 
 
 if __name__ == "__main__":
@@ -3,26 +3,69 @@ State management for Claude Code sessions and tool tracking.
 Manages session state, active tools, token usage, and UI updates.
 """
 
+import functools
 import json
 import logging
 import random
+import re
 import sys
 import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Optional, List, Set
+from typing import Deque, Dict, Optional, List, Set
 from PySide6.QtCore import QObject, QTimer, Signal
 
+# orjson parses the transcript JSONL lines several times faster than the
+# stdlib; fall back transparently when it isn't installed.
+try:
+    import orjson
+    _loads = orjson.loads
+    _json_decode_error = orjson.JSONDecodeError
+except ImportError:
+    _loads = json.loads
+    _json_decode_error = json.JSONDecodeError
+
 logger = logging.getLogger(__name__)
 
+# Monotonic clock for all elapsed/staleness math — unlike time.time() it
+# can't jump backward under NTP adjustments, and it's marginally cheaper.
+# These timestamps are only ever compared against each other, never shown
+# as wall-clock times.
+_now = time.monotonic
+
+# Field order for the /status serialization — paired with the attrgetters
+# below so _build_status_sessions is a zip instead of per-field lookups.
+_SESSION_FIELDS = (
+    'session_id', 'project_name', 'project_path',
+    'is_active', 'context_percent', 'permission_mode',
+)
+_TOOL_FIELDS = ('tool_name', 'display_name', 'category', 'attention')
+_get_session_fields = attrgetter(*_SESSION_FIELDS)
+_get_tool_fields = attrgetter(*_TOOL_FIELDS)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_json(path: str) -> dict:
+    """Load and parse a config file once per path.
+
+    The design config is read-only at runtime, and several components
+    (StateManager, overlay, settings dialog) each construct a NotchConfig;
+    caching on the path string means one disk read and parse per file.
+    """
+    with open(path, 'r') as f:
+        return json.load(f)
+
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class ActiveTool:
     """Represents an active tool being used by Claude."""
     tool_name: str
-    started_at: float = field(default_factory=time.time)
+    started_at: float = field(default_factory=_now)
     description: str = ""
     category: str = "think"
     display_name: str = "Working"
@@ -31,7 +74,7 @@ class ActiveTool:
     attention: str = "ambient"
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class TokenStats:
     """Token usage statistics."""
     input_tokens: int = 0
@@ -49,16 +92,18 @@ class TokenStats:
         return self.total_tokens + self.cache_creation_tokens
 
 
-@dataclass
+@dataclass(slots=True, eq=False, match_args=False)
 class SessionState:
     """Represents a Claude Code session."""
     session_id: str
     project_path: str
     project_name: str
-    start_time: float = field(default_factory=time.time)
-    last_activity: float = field(default_factory=time.time)
+    start_time: float = field(default_factory=_now)
+    last_activity: float = field(default_factory=_now)
     active_tool: Optional[ActiveTool] = None
-    recent_tools: List[ActiveTool] = field(default_factory=list)
+    # Newest-first, bounded; deque gives O(1) appendleft with automatic
+    # eviction instead of list.insert(0, ...) plus a slice per event.
+    recent_tools: Deque[ActiveTool] = field(default_factory=lambda: deque(maxlen=10))
     is_active: bool = True
     permission_mode: str = "normal"
     token_stats: TokenStats = field(default_factory=TokenStats)
@@ -68,11 +113,22 @@ class SessionState:
     pid: Optional[int] = None
     transcript_path: str = ""
     last_token_read_time: float = 0.0
+    # Bumped on every state mutation so the UI can skip repaints when nothing
+    # changed (cards compare the revision they last displayed against this).
+    revision: int = 0
+    # Resolved once in __post_init__ — project_path/project_name never
+    # change after creation, and display_name is read on every repaint.
+    _display_name: str = ""
+
+    def __post_init__(self):
+        self._display_name = (
+            self.project_name or Path(self.project_path).name or "Unknown"
+        )
 
     @property
     def display_name(self) -> str:
         """Get display name for session."""
-        return self.project_name or Path(self.project_path).name or "Unknown"
+        return self._display_name
 
     @property
     def status_text(self) -> str:
@@ -84,11 +140,11 @@ class SessionState:
     @property
     def is_stale(self) -> bool:
         """Check if session is stale (no activity for >60s). Use is_stale_at for dynamic timeout."""
-        return time.time() - self.last_activity > 60
+        return _now() - self.last_activity > 60
 
     def is_stale_at(self, timeout: int = 60) -> bool:
         """Check if session is stale with a configurable timeout."""
-        return time.time() - self.last_activity > timeout
+        return _now() - self.last_activity > timeout
 
 
 class NotchConfig:
@@ -101,8 +157,7 @@ class NotchConfig:
             base = getattr(sys, '_MEIPASS', Path(__file__).parent.parent)
             config_path = Path(base) / "config" / "notch-config.json"
 
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = _load_config_json(str(config_path))
 
         self.categories = self.config.get('categories', {})
         self.tools = self.config.get('tools', {})
@@ -112,8 +167,37 @@ class NotchConfig:
         self.defaults = self.config.get('defaults', {})
         self.attention_levels = self.config.get('attention_levels', {})
 
+        # The config is immutable after load, so merged tool lookups are
+        # precomputed for every configured tool (keyed on the exact name
+        # hooks send; unknown spellings fill in lazily) and the
+        # duration-evolution thresholds are flattened once instead of
+        # re-walking nested dicts on every animation frame.
+        self._tool_info_cache: Dict[str, Dict] = {
+            name: self._compute_tool_info(name) for name in self.tools
+        }
+        self._color_rgb = {
+            name: tuple(cfg.get('rgb', [249, 115, 22]))
+            for name, cfg in self.colors.items()
+        }
+        evolution = self.config.get('duration_evolution', {})
+        self._duration_levels = tuple(
+            (level.get('until'), name, level.get('speedMult', 1.0))
+            for name, level in (
+                (n, evolution.get(n, {}))
+                for n in ('normal', 'extended', 'long', 'stuck')
+            )
+        )
+
     def get_tool_info(self, tool_name: str) -> Dict:
-        """Get tool configuration with category info merged."""
+        """Get tool configuration with category info merged (memoized)."""
+        cached = self._tool_info_cache.get(tool_name)
+        if cached is None:
+            cached = self._tool_info_cache[tool_name] = \
+                self._compute_tool_info(tool_name)
+        return cached
+
+    def _compute_tool_info(self, tool_name: str) -> Dict:
+        """Build the merged tool/category dict for get_tool_info."""
         tool_name_lower = tool_name.lower()
 
         # Get tool config (or use default)
@@ -139,8 +223,10 @@ class NotchConfig:
 
     def get_color_rgb(self, color_name: str) -> tuple:
         """Get RGB tuple for a color name."""
-        color_config = self.colors.get(color_name, self.colors.get('orange', {}))
-        return tuple(color_config.get('rgb', [249, 115, 22]))
+        rgb = self._color_rgb.get(color_name)
+        if rgb is None:
+            rgb = self._color_rgb.get('orange', (249, 115, 22))
+        return rgb
 
     def get_pattern_config(self, pattern_name: str) -> Dict:
         """Get pattern configuration."""
@@ -152,12 +238,9 @@ class NotchConfig:
 
     def get_duration_speed_mult(self, elapsed_seconds: float) -> tuple:
         """Return (level_name, speed_multiplier) for duration evolution."""
-        evolution = self.config.get('duration_evolution', {})
-        for level_name in ['normal', 'extended', 'long', 'stuck']:
-            level = evolution.get(level_name, {})
-            until = level.get('until')
+        for until, level_name, speed_mult in self._duration_levels:
             if until is None or elapsed_seconds < until:
-                return (level_name, level.get('speedMult', 1.0))
+                return (level_name, speed_mult)
         return ('stuck', 0.3)
 
 
@@ -187,7 +270,9 @@ class StateManager(QObject):
         self.sessions: Dict[str, SessionState] = {}
         self.pinned_paths: Set[str] = set()
         self.active_session_id: Optional[str] = None
-        self.last_activity_time = time.time()
+        self.last_activity_time = _now()
+        # Timestamp of the hook event currently being handled
+        self._event_time = self.last_activity_time
 
         # Grace period timer — shows "Thinking" between tool calls instead of "Idle"
         self._grace_timer = QTimer(self)
@@ -200,10 +285,125 @@ class StateManager(QObject):
         thinking_state = self.config.states.get('thinking', {})
         self._fun_verbs = thinking_state.get('funVerbs', ['Thinking'])
 
+        # Thinking-state template — the category/color/pattern lookups are
+        # pure functions of the config, so resolve them once instead of on
+        # every grace-period transition.
+        category_name = thinking_state.get('category', 'think')
+        category = self.config.categories.get(category_name, {})
+        self._thinking_template = dict(
+            tool_name='_thinking',
+            category=category_name,
+            color=category.get('color', 'orange'),
+            pattern=category.get('pattern', 'cogitate'),
+            attention=category.get('attention', 'ambient'),
+        )
+
+        # Coalesce UI update signals — a burst of hook events collapses
+        # into at most one session_updated per session and one
+        # activity_changed per ~frame (16ms). Alert-style signals
+        # (notification_received, error_detected, attention_needed,
+        # tool_started/ended) stay immediate.
+        self._pending_updates: Set[str] = set()
+        self._activity_dirty = False
+        self._batching = False
+        self._silenced = False
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(self._flush_updates)
+
+        # Timeout thresholds, cached — consulted once per session in the
+        # display/cleanup loops and on every is_idle read, but they only
+        # change when the user edits preferences.
+        self._activity_timeout = self._read_timeout("activity_timeout", 'activityTimeout', 60)
+        self._idle_timeout = self._read_timeout("idle_timeout", 'idleTimeout', 15)
+        if self.user_settings is not None:
+            self.user_settings.settings_changed.connect(self._on_setting_changed)
+
+        # Insertion-ordered index of sessions that are active or running a
+        # tool — get_current_session and has_activity answer from this
+        # instead of scanning every session. Plain dict keeps insertion
+        # order; values are unused.
+        self._active_sessions: Dict[str, None] = {}
+
+        # get_status_dict cache — the /status endpoint polls far more often
+        # than sessions change. The dirty flag is raised wherever state
+        # mutates; only the time-derived fields are refreshed per call.
+        self._status_dirty = True
+        self._status_cache: List[tuple] = []
+
+        # Byte offset of the last fully-parsed transcript line, per path —
+        # repeat reads only parse what Claude appended since.
+        self._transcript_offsets: Dict[str, int] = {}
+
         from session_stats import SessionStats
         self.session_stats = SessionStats()
         self._token_update.connect(self._apply_token_update)
 
+        # Hook-event dispatch — one dict lookup instead of walking an
+        # if/elif chain for every event.
+        self._hook_handlers = {
+            'PreToolUse': self._handle_pre_tool_use,
+            'PostToolUse': self._handle_post_tool_use,
+            'Stop': self._handle_stop,
+            'SubagentStop': self._handle_stop,
+            'SessionStart': self._handle_session_start,
+            'SessionEnd': self._handle_session_end,
+            'Notification': self._handle_notification,
+            'UserPromptSubmit': self._handle_user_prompt,
+        }
+
+    def _schedule_update(self, session_id: Optional[str] = None):
+        """Queue coalesced session_updated/activity_changed emissions."""
+        self._status_dirty = True
+        if self._silenced:
+            return
+        if session_id is not None:
+            self._pending_updates.add(session_id)
+        self._activity_dirty = True
+        if not self._batching and not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    @contextmanager
+    def batch(self):
+        """Defer update signals for a bulk operation into one flush.
+
+        Useful when replaying many queued events: the coalesced
+        session_updated/activity_changed emissions fire once on exit
+        instead of per timer tick. Nests harmlessly.
+        """
+        if self._batching:
+            yield
+            return
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._pending_updates or self._activity_dirty:
+                self._flush_updates()
+
+    @contextmanager
+    def suppress(self):
+        """Discard update signals entirely while the scope is active."""
+        if self._silenced:
+            yield
+            return
+        self._silenced = True
+        try:
+            yield
+        finally:
+            self._silenced = False
+
+    def _flush_updates(self):
+        """Emit the coalesced update signals (last-one-wins per session)."""
+        pending, self._pending_updates = self._pending_updates, set()
+        for session_id in pending:
+            self.session_updated.emit(session_id)
+        if self._activity_dirty:
+            self._activity_dirty = False
+            self.activity_changed.emit()
+
     def handle_event(self, event_type: str, data: dict):
         """
         Handle hook event from Claude Code.
@@ -227,12 +427,14 @@ class StateManager(QObject):
 
         logger.debug(f"Hook event: {event_name} | tool: {data.get('tool', 'N/A')} | session: {session_id}")
 
-        # Update last activity time
-        self.last_activity_time = time.time()
+        # Update last activity time — one clock read per event, reused by
+        # the handlers below via _event_time.
+        now = self._event_time = _now()
+        self.last_activity_time = now
 
         # Get or create session
         session = self._get_or_create_session(session_id, cwd)
-        session.last_activity = time.time()
+        session.last_activity = now
 
         # Save permission mode if present
         perm_mode = data.get('permissionMode')
@@ -240,27 +442,17 @@ class StateManager(QObject):
             session.permission_mode = perm_mode
 
         # Handle different event types
-        if event_name == 'PreToolUse':
-            self._handle_pre_tool_use(session, data)
-        elif event_name == 'PostToolUse':
-            self._handle_post_tool_use(session, data)
-        elif event_name in ['Stop', 'SubagentStop']:
-            self._handle_stop(session)
-        elif event_name == 'SessionStart':
-            self._handle_session_start(session, data)
-        elif event_name == 'SessionEnd':
-            self._handle_session_end(session)
-        elif event_name == 'Notification':
-            self._handle_notification(session, data)
-        elif event_name == 'UserPromptSubmit':
-            self._handle_user_prompt(session, data)
+        handler = self._hook_handlers.get(event_name)
+        if handler is not None:
+            handler(session, data)
 
         # Update token usage from transcript if available
         self._update_token_usage(session, data)
 
-        # Emit update signal
-        self.session_updated.emit(session_id)
-        self.activity_changed.emit()
+        # Mark session dirty for the UI and queue the update signals
+        session.revision += 1
+        self._refresh_active_index(session)
+        self._schedule_update(session_id)
 
     def _handle_pre_tool_use(self, session: SessionState, data: dict):
         """Handle PreToolUse event."""
@@ -280,6 +472,7 @@ class StateManager(QObject):
         # Create active tool
         active_tool = ActiveTool(
             tool_name=tool_name,
+            started_at=self._event_time,
             display_name=tool_info['display_name'],
             category=tool_info['category'],
             color=tool_info['color'],
@@ -291,9 +484,8 @@ class StateManager(QObject):
         session.active_tool = active_tool
         session.is_active = True
 
-        # Add to recent tools
-        session.recent_tools.insert(0, active_tool)
-        session.recent_tools = session.recent_tools[:10]  # Keep last 10
+        # Add to recent tools (bounded deque keeps the newest 10)
+        session.recent_tools.appendleft(active_tool)
 
         self.tool_started.emit(session.session_id, tool_name)
 
@@ -310,7 +502,7 @@ class StateManager(QObject):
 
         # Record tool usage stats (exclude synthetic _thinking tool)
         if session.active_tool and session.active_tool.tool_name != '_thinking':
-            elapsed = time.time() - session.active_tool.started_at
+            elapsed = self._event_time - session.active_tool.started_at
             self.session_stats.record_tool_use(
                 session.active_tool.tool_name,
                 session.active_tool.category,
@@ -319,8 +511,8 @@ class StateManager(QObject):
 
         self._start_grace_period(session)
 
-    def _handle_stop(self, session: SessionState):
-        """Handle Stop event (Claude finished responding)."""
+    def _handle_stop(self, session: SessionState, data: dict):
+        """Handle Stop/SubagentStop event (Claude finished responding)."""
         if session.active_tool:
             self.tool_ended.emit(session.session_id, session.active_tool.tool_name)
         self._start_grace_period(session)
@@ -328,7 +520,7 @@ class StateManager(QObject):
 
     def _handle_session_start(self, session: SessionState, data: dict):
         """Handle SessionStart event."""
-        session.start_time = time.time()
+        session.start_time = self._event_time
         session.is_active = True
 
         # Capture terminal HWND for click-to-focus (always resolve so
@@ -342,7 +534,7 @@ class StateManager(QObject):
             except Exception:
                 pass
 
-    def _handle_session_end(self, session: SessionState):
+    def _handle_session_end(self, session: SessionState, data: dict):
         """Handle SessionEnd event."""
         session.is_active = False
         self.session_ended.emit(session.session_id)
@@ -373,6 +565,9 @@ class StateManager(QObject):
         'Permission denied',
         'Traceback (most recent call last)',
     )
+    # Alternation regex — one C-speed scan of stderr instead of one full
+    # substring pass per pattern.
+    _STDERR_ERROR_RE = re.compile('|'.join(map(re.escape, _STDERR_ERROR_PATTERNS)))
 
     def _check_bash_error(self, session: SessionState, data: dict):
         """Check Bash tool result for error indicators.
@@ -395,10 +590,10 @@ class StateManager(QObject):
                 # If exit code is 0 or absent, check stderr only as fallback
                 stderr = tool_result.get('stderr', '')
                 if stderr:
-                    for pattern in self._STDERR_ERROR_PATTERNS:
-                        if pattern in stderr:
-                            self.error_detected.emit(session.session_id, 'Bash')
-                            return
+                    # Errors surface at the tail; cap the scan on huge output
+                    if self._STDERR_ERROR_RE.search(stderr[-8192:]):
+                        self.error_detected.emit(session.session_id, 'Bash')
+                        return
             # String result — no structured exit code available; skip heuristics
             # to avoid false positives on unstructured output.
         except Exception as e:
@@ -406,21 +601,12 @@ class StateManager(QObject):
 
     def _start_grace_period(self, session: SessionState):
         """Transition to 'Thinking' state for the grace period."""
-        # Pick a random fun verb from config
-        verb = random.choice(self._fun_verbs)
-
-        # Get thinking category info for color/pattern
-        thinking_state = self.config.states.get('thinking', {})
-        category_name = thinking_state.get('category', 'think')
-        category = self.config.categories.get(category_name, {})
-
+        # Pick a random fun verb from config; everything else comes from
+        # the template resolved at construction.
         session.active_tool = ActiveTool(
-            tool_name='_thinking',
-            display_name=verb,
-            category=category_name,
-            color=category.get('color', 'orange'),
-            pattern=category.get('pattern', 'cogitate'),
-            attention=category.get('attention', 'ambient'),
+            display_name=random.choice(self._fun_verbs),
+            started_at=self._event_time,
+            **self._thinking_template,
         )
 
         # Start (or restart) the grace timer
@@ -434,8 +620,9 @@ class StateManager(QObject):
             # Only clear if still showing the synthetic thinking tool
             if session.active_tool and session.active_tool.tool_name == '_thinking':
                 session.active_tool = None
-                self.session_updated.emit(session.session_id)
-                self.activity_changed.emit()
+                session.revision += 1
+                self._refresh_active_index(session)
+                self._schedule_update(session.session_id)
         self._grace_session_id = None
 
     def _handle_pin_event(self, data: dict):
@@ -446,13 +633,13 @@ class StateManager(QObject):
         if cwd:
             self.pinned_paths.add(cwd)
             logger.info(f"Pinned session: {cwd}")
-            self.activity_changed.emit()
+            self._schedule_update()
 
     def _handle_unpin_event(self, data: dict):
         """Handle session unpin event."""
         self.pinned_paths.clear()
         logger.info("Unpinned all sessions")
-        self.activity_changed.emit()
+        self._schedule_update()
 
     def _get_or_create_session(self, session_id: str, cwd: str) -> SessionState:
         """Get existing session or create new one."""
@@ -480,7 +667,7 @@ class StateManager(QObject):
         if not path:
             return
         session.transcript_path = path
-        now = time.time()
+        now = _now()
         if now - session.last_token_read_time < 5.0:
             return
         session.last_token_read_time = now
@@ -493,22 +680,38 @@ class StateManager(QObject):
         t.start()
 
     def _read_transcript(self, session_id: str, path: str):
-        """Background thread: read JSONL transcript and extract last usage."""
+        """Background thread: parse transcript lines appended since last read."""
         try:
+            start = self._transcript_offsets.get(path, 0)
+            with open(path, 'rb') as f:
+                f.seek(0, 2)
+                size = f.tell()
+                if size < start:
+                    start = 0  # file truncated/rotated — reparse from scratch
+                if size == start:
+                    return  # nothing new since the last read
+                f.seek(start)
+                data = f.read()
+
+            # Only complete lines advance the offset; an unterminated
+            # tail may be a record mid-write, so its bytes stay unconsumed
+            # and are retried next pass (though we still use the tail now
+            # if it already parses — transcripts may end without a newline).
+            end = data.rfind(b'\n')
+            if end >= 0:
+                self._transcript_offsets[path] = start + end + 1
+                complete, tail = data[:end], data[end + 1:]
+            else:
+                complete, tail = b'', data
+
             last_usage = None
-            with open(path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        obj = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    if obj.get('type') == 'assistant':
-                        msg = obj.get('message', {})
-                        if isinstance(msg, dict) and 'usage' in msg:
-                            last_usage = msg['usage']
+            for line in complete.split(b'\n'):
+                usage = self._extract_usage(line)
+                if usage is not None:
+                    last_usage = usage
+            usage = self._extract_usage(tail)
+            if usage is not None:
+                last_usage = usage
             if last_usage:
                 self._token_update.emit(
                     session_id,
@@ -520,6 +723,22 @@ class StateManager(QObject):
         except Exception as e:
             logger.debug(f"Failed to read transcript: {e}")
 
+    @staticmethod
+    def _extract_usage(line: bytes) -> Optional[dict]:
+        """Return the usage dict from an assistant transcript line, if any."""
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            obj = _loads(line)
+        except _json_decode_error:
+            return None
+        if obj.get('type') == 'assistant':
+            msg = obj.get('message', {})
+            if isinstance(msg, dict) and 'usage' in msg:
+                return msg['usage']
+        return None
+
     def _apply_token_update(self, session_id: str, input_t: int, output_t: int,
                             cache_create: int, cache_read: int):
         """Main-thread slot: apply token stats from background reader."""
@@ -534,32 +753,24 @@ class StateManager(QObject):
         total_input = input_t + cache_create + cache_read
         session.context_tokens = total_input + output_t
         session.context_percent = min((total_input / context_window) * 100, 100)
-        self.session_updated.emit(session_id)
-        self.activity_changed.emit()
+        session.revision += 1
+        self._schedule_update(session_id)
 
     def get_status_dict(self) -> dict:
         """Return a serializable dict of current state for the /status endpoint."""
-        # Snapshot to avoid RuntimeError if dict mutates during iteration
-        sessions_snapshot = dict(self.sessions)
+        if self._status_dirty:
+            # Clear before rebuilding: this runs on the HTTP server thread
+            # while the GUI thread raises the flag, so a mutation landing
+            # mid-build re-marks it and the next poll rebuilds again.
+            self._status_dirty = False
+            self._status_cache = self._build_status_sessions()
+        # elapsed_seconds and is_idle are time-derived, so they get
+        # refreshed on every call even when the cache is warm.
+        now = _now()
         sessions_list = []
-        for s in sessions_snapshot.values():
-            session_dict = {
-                "session_id": s.session_id,
-                "project_name": s.project_name,
-                "project_path": s.project_path,
-                "is_active": s.is_active,
-                "context_percent": round(s.context_percent, 1),
-                "permission_mode": s.permission_mode,
-                "active_tool": None,
-            }
-            if s.active_tool:
-                session_dict["active_tool"] = {
-                    "tool_name": s.active_tool.tool_name,
-                    "display_name": s.active_tool.display_name,
-                    "category": s.active_tool.category,
-                    "attention": s.active_tool.attention,
-                    "elapsed_seconds": round(time.time() - s.active_tool.started_at, 1),
-                }
+        for session_dict, started_at in self._status_cache:
+            if started_at is not None:
+                session_dict["active_tool"]["elapsed_seconds"] = round(now - started_at, 1)
             sessions_list.append(session_dict)
         return {
             "status": "running",
@@ -568,29 +779,64 @@ class StateManager(QObject):
             "sessions": sessions_list,
         }
 
+    def _build_status_sessions(self) -> List[tuple]:
+        """Serialize sessions for get_status_dict.
+
+        Returns (session_dict, started_at) pairs; started_at is kept so the
+        cached dict's elapsed_seconds can be refreshed without a rebuild.
+        """
+        # Snapshot to avoid RuntimeError if dict mutates during iteration
+        sessions_snapshot = dict(self.sessions)
+        cache = []
+        for s in sessions_snapshot.values():
+            session_dict = dict(zip(_SESSION_FIELDS, _get_session_fields(s)))
+            session_dict["context_percent"] = round(session_dict["context_percent"], 1)
+            session_dict["active_tool"] = None
+            started_at = None
+            if s.active_tool:
+                started_at = s.active_tool.started_at
+                tool_dict = dict(zip(_TOOL_FIELDS, _get_tool_fields(s.active_tool)))
+                tool_dict["elapsed_seconds"] = 0.0
+                session_dict["active_tool"] = tool_dict
+            cache.append((session_dict, started_at))
+        return cache
+
+    def _refresh_active_index(self, session: SessionState):
+        """Keep the active-session index in sync after a state mutation."""
+        if session.is_active or session.active_tool:
+            self._active_sessions[session.session_id] = None
+        else:
+            self._active_sessions.pop(session.session_id, None)
+
     def get_current_session(self) -> Optional[SessionState]:
         """Get the currently active session."""
         if self.active_session_id and self.active_session_id in self.sessions:
             return self.sessions[self.active_session_id]
 
-        # Return any active session
-        for session in self.sessions.values():
-            if session.is_active or session.active_tool:
-                return session
+        # Return any active session (oldest first, from the index)
+        session_id = next(iter(self._active_sessions), None)
+        if session_id is not None:
+            return self.sessions[session_id]
 
         return None
 
     def get_display_sessions(self) -> List[SessionState]:
         """Get sessions to display (active or pinned)."""
         activity_timeout = self._get_activity_timeout()
-        display = []
-
-        for session in self.sessions.values():
-            # Show if active, has active tool, or is pinned
-            if session.is_active or session.active_tool or session.project_path in self.pinned_paths:
-                if not session.is_stale_at(activity_timeout):
-                    display.append(session)
 
+        # Active / tool-running sessions come straight from the maintained
+        # index; pinned-but-idle sessions still need a scan, but only when
+        # pins actually exist (they usually don't).
+        candidates = {sid: self.sessions[sid] for sid in self._active_sessions}
+        if self.pinned_paths:
+            for sid, session in self.sessions.items():
+                if sid not in candidates and session.project_path in self.pinned_paths:
+                    candidates[sid] = session
+
+        display = [
+            session for session in candidates.values()
+            if not session.is_stale_at(activity_timeout)
+        ]
         return sorted(display, key=lambda s: s.last_activity, reverse=True)
 
     def cleanup_stale_sessions(self):
@@ -604,24 +850,35 @@ class StateManager(QObject):
 
         for session_id in to_remove:
             logger.debug(f"Removing stale session: {session_id}")
+            self._transcript_offsets.pop(self.sessions[session_id].transcript_path, None)
+            self._active_sessions.pop(session_id, None)
             del self.sessions[session_id]
+        if to_remove:
+            self._status_dirty = True
 
-    def _get_activity_timeout(self) -> int:
-        """Get activity timeout from user settings or config defaults."""
+    def _read_timeout(self, settings_key: str, config_key: str, fallback: int) -> int:
+        """Read a timeout from user settings or config defaults."""
         if self.user_settings:
-            return self.user_settings.get("activity_timeout")
-        return self.config.defaults.get('activityTimeout', 60)
+            return self.user_settings.get(settings_key)
+        return self.config.defaults.get(config_key, fallback)
+
+    def _on_setting_changed(self, key: str):
+        """Refresh cached timeout thresholds when settings change."""
+        if key == "activity_timeout":
+            self._activity_timeout = self.user_settings.get(key)
+        elif key == "idle_timeout":
+            self._idle_timeout = self.user_settings.get(key)
+
+    def _get_activity_timeout(self) -> int:
+        """Get the cached activity timeout."""
+        return self._activity_timeout
 
     @property
     def has_activity(self) -> bool:
         """Check if there's any current activity."""
-        return any(s.is_active or s.active_tool for s in self.sessions.values())
+        return bool(self._active_sessions)
 
     @property
     def is_idle(self) -> bool:
         """Check if system has been idle."""
-        if self.user_settings:
-            idle_timeout = self.user_settings.get("idle_timeout")
-        else:
-            idle_timeout = self.config.defaults.get('idleTimeout', 15)
-        return time.time() - self.last_activity_time > idle_timeout
+        return _now() - self.last_activity_time > self._idle_timeout
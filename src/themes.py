@@ -4,6 +4,8 @@ Provides dark and light theme color tokens, Qt stylesheet generation
 for SettingsDialog, and overlay color helpers. No external dependencies.
 """
 
+import functools
+
 # ---------------------------------------------------------------------------
 # Theme token dictionaries
 # ---------------------------------------------------------------------------
@@ -36,6 +38,35 @@ _LIGHT = {
     "tab_selected": "#fff",
 }
 
+def _augment(theme: dict) -> None:
+    """Bake brightness-derived tokens into *theme* at import time.
+
+    Every consumer used to recompute ``sum(bg) / 3`` and branch on the
+    result; the themes are module-level constants, so the derived values
+    are resolved once here instead.
+    """
+    bg = theme["bg"]
+    dark = sum(bg) / 3 < 128
+    # Dim squares: slightly lighter than background for dark, slightly
+    # darker for light — shift each channel toward the middle.
+    if dark:
+        theme["dim_square_rgb"] = tuple(min(c + 30, 255) for c in bg)
+    else:
+        theme["dim_square_rgb"] = tuple(max(c - 30, 0) for c in bg)
+    theme["arrow"] = "#aaa" if dark else "#666"
+    theme["input_text"] = "#eee" if dark else theme["text"]
+    theme["tab_text"] = "#ccc" if dark else theme["text_secondary"]
+    theme["groupbox_color"] = "#aaa" if dark else theme["text_muted"]
+    theme["pane_border"] = "#444" if dark else theme["border"]
+    theme["groupbox_border"] = "#444" if dark else theme["border"]
+    theme["checkbox_border"] = "#666" if dark else theme["border"]
+    theme["button_hover"] = "#444" if dark else "#bbb"
+    theme["slider_groove"] = "#333" if dark else "#ccc"
+
+
+_augment(_DARK)
+_augment(_LIGHT)
+
 THEMES: dict = {
     "dark": _DARK,
     "light": _LIGHT,
@@ -62,7 +93,7 @@ def get_theme_names() -> list:
 
 
 def get_overlay_colors(theme: dict) -> dict:
-    """Return overlay-specific colour values derived from *theme*.
+    """Return overlay-specific colour values from *theme*.
 
     Keys returned:
         bg_rgb              -- background as (r, g, b) tuple
@@ -70,22 +101,15 @@ def get_overlay_colors(theme: dict) -> dict:
         text_secondary_css  -- secondary text as CSS colour string
         text_muted_css      -- muted text as CSS colour string
         dim_square_rgb      -- colour tuple for dim squares in ActivityIndicator
-    """
-    bg = theme["bg"]
-    # Dim squares: slightly lighter than background for dark, slightly darker
-    # for light.  A simple heuristic: shift each channel toward the middle.
-    brightness = sum(bg) / 3
-    if brightness < 128:
-        dim = tuple(min(c + 30, 255) for c in bg)
-    else:
-        dim = tuple(max(c - 30, 0) for c in bg)
 
+    All values are precomputed by ``_augment`` at import time.
+    """
     return {
-        "bg_rgb": bg,
+        "bg_rgb": theme["bg"],
         "text_css": theme["text"],
         "text_secondary_css": theme["text_secondary"],
         "text_muted_css": theme["text_muted"],
-        "dim_square_rgb": dim,
+        "dim_square_rgb": theme["dim_square_rgb"],
     }
 
 
@@ -94,93 +118,119 @@ def get_overlay_colors(theme: dict) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def _arrow_color(theme: dict) -> str:
-    """Return the CSS colour used for spin-box / combo-box arrows."""
-    # Dark theme uses #aaa, light theme uses #666.
-    brightness = sum(theme["bg"]) / 3
-    return "#aaa" if brightness < 128 else "#666"
+_STYLESHEET_TEMPLATE = (
+    # --- Tab widget ---
+    "QTabWidget::pane {{ border: 1px solid {pane_border}; background: transparent;"
+    " border-radius: 6px; }}\n"
+    "QTabBar::tab {{ background: {tab_bg}; color: {tab_text};"
+    " padding: 8px 18px; margin-right: 2px;"
+    " border-top-left-radius: 6px; border-top-right-radius: 6px; }}\n"
+    "QTabBar::tab:selected {{ background: {tab_selected}; color: {text}; }}\n"
+    "QTabBar::tab:hover {{ background: {bg_hover}; }}\n"
+    # --- Labels ---
+    "QLabel {{ color: {text_secondary}; font-size: 13px; }}\n"
+    # --- Inputs ---
+    "QSpinBox, QComboBox, QLineEdit {{ background: {bg_alt}; color: {input_text};"
+    " border: 1px solid {border}; border-radius: 4px;"
+    " padding: 4px 8px; min-width: 80px; }}\n"
+    # --- SpinBox buttons/arrows ---
+    "QSpinBox::up-button, QSpinBox::down-button {{ background: {bg_hover};"
+    " border: none; width: 16px; }}\n"
+    "QSpinBox::up-arrow {{ image: none;"
+    " border-left: 4px solid transparent; border-right: 4px solid transparent;"
+    " border-bottom: 5px solid {arrow}; }}\n"
+    "QSpinBox::down-arrow {{ image: none;"
+    " border-left: 4px solid transparent; border-right: 4px solid transparent;"
+    " border-top: 5px solid {arrow}; }}\n"
+    # --- Checkboxes ---
+    "QCheckBox {{ color: {text_secondary}; font-size: 13px; spacing: 8px; }}\n"
+    "QCheckBox::indicator {{ width: 18px; height: 18px; border-radius: 3px;"
+    " border: 1px solid {checkbox_border}; background: {bg_alt}; }}\n"
+    "QCheckBox::indicator:checked {{ background: {accent};"
+    " border-color: {accent}; }}\n"
+    # --- Sliders ---
+    "QSlider::groove:horizontal {{ height: 6px; background: {slider_groove};"
+    " border-radius: 3px; }}\n"
+    "QSlider::handle:horizontal {{ background: {accent};"
+    " width: 16px; height: 16px; margin: -5px 0; border-radius: 8px; }}\n"
+    "QSlider::sub-page:horizontal {{ background: {accent};"
+    " border-radius: 3px; }}\n"
+    # --- Buttons ---
+    "QPushButton {{ background: {bg_hover}; color: {text_secondary};"
+    " border: 1px solid {border}; border-radius: 6px;"
+    " padding: 6px 16px; font-size: 13px; }}\n"
+    "QPushButton:hover {{ background: {button_hover}; }}\n"
+    "QPushButton:pressed {{ background: {bg_pressed}; }}\n"
+    # --- GroupBox ---
+    "QGroupBox {{ color: {groupbox_color}; border: 1px solid {groupbox_border};"
+    " border-radius: 6px; margin-top: 12px; padding-top: 16px;"
+    " font-size: 12px; }}\n"
+    "QGroupBox::title {{ subcontrol-origin: margin; left: 12px;"
+    " padding: 0 6px; }}\n"
+    # --- ComboBox dropdown ---
+    "QComboBox::drop-down {{ border: none; width: 20px; }}\n"
+    "QComboBox::down-arrow {{ image: none;"
+    " border-left: 4px solid transparent; border-right: 4px solid transparent;"
+    " border-top: 5px solid {arrow}; }}\n"
+    "QComboBox QAbstractItemView {{ background: {bg_alt}; color: {input_text};"
+    " selection-background-color: {accent};"
+    " border: 1px solid {border}; }}\n"
+    # --- Plain text editor (project colors) ---
+    "QPlainTextEdit {{ background: {bg_alt}; color: {input_text};"
+    " border: 1px solid {border}; border-radius: 4px;"
+    " padding: 4px; font-size: 12px; }}\n"
+    # --- Object-name roles (replaces repeated inline setStyleSheet) ---
+    "QLabel#dialogTitle {{ color: {text}; font-size: 16px;"
+    " font-weight: bold; }}\n"
+    "QLabel#hint {{ color: {text_muted}; font-size: 11px; }}\n"
+    "QLabel#path {{ color: #999; font-size: 11px; }}\n"
+    "QLabel#statName {{ color: {text_secondary}; font-size: 12px; }}\n"
+    "QLabel#statValue {{ color: {accent}; font-size: 12px;"
+    " font-weight: bold; }}\n"
+    "QPushButton#titleClose {{ background: transparent; color: {groupbox_color};"
+    " font-size: 16px; border: none; border-radius: 14px; padding: 0; }}\n"
+    "QPushButton#titleClose:hover {{ background: #c0392b; color: #fff; }}\n"
+    "QLabel#empty {{ color: {text_muted}; font-size: 12px; }}\n"
+    # Webhook test status — colored via a dynamic property, same scheme
+    # as the hook status label below but smaller and with a muted idle
+    # state.
+    'QLabel#webhookStatus {{ color: {text_muted}; font-size: 11px; }}\n'
+    'QLabel#webhookStatus[status="ok"] {{ color: #4a9; }}\n'
+    'QLabel#webhookStatus[status="err"] {{ color: #e74c3c; }}\n'
+    # Hook install status label — colored via a dynamic property so the
+    # dialog can keep it in plain-text mode.
+    'QLabel#hookStatus[status="ok"] {{ color: #4a9; font-weight: bold; }}\n'
+    'QLabel#hookStatus[status="err"] {{ color: #e74c3c; font-weight: bold; }}\n'
+)
 
 
 def generate_dialog_stylesheet(theme: dict) -> str:
     """Generate the full Qt stylesheet for *SettingsDialog*.
 
+    Built once per theme — the dicts are module-level constants, so known
+    themes resolve to a memoized string and repeat calls (theme toggles,
+    dialog reopens) are a cache hit.
+
     When called with the dark theme this produces output identical to the
     original hard-coded ``_DARK_STYLE``.
     """
-    t = theme
-    arrow = _arrow_color(t)
-
-    # For input text we pick a colour close to theme["text"] but not quite
-    # full-white in dark mode (matches the original #eee).
-    brightness = sum(t["bg"]) / 3
-    input_text = "#eee" if brightness < 128 else t["text"]
-
-    # Tab text for unselected tabs: #ccc in dark, text_secondary in light.
-    tab_text = "#ccc" if brightness < 128 else t["text_secondary"]
-
-    # GroupBox title / border colour and button text reuse existing tokens.
-    groupbox_color = "#aaa" if brightness < 128 else t["text_muted"]
-    pane_border = "#444" if brightness < 128 else t["border"]
-    groupbox_border = "#444" if brightness < 128 else t["border"]
-    checkbox_border = "#666" if brightness < 128 else t["border"]
-    button_hover = "#444" if brightness < 128 else "#bbb"
-    slider_groove = "#333" if brightness < 128 else "#ccc"
-
-    return (
-        # --- Tab widget ---
-        f"QTabWidget::pane {{ border: 1px solid {pane_border}; background: transparent;"
-        f" border-radius: 6px; }}\n"
-        f"QTabBar::tab {{ background: {t['tab_bg']}; color: {tab_text};"
-        f" padding: 8px 18px; margin-right: 2px;"
-        f" border-top-left-radius: 6px; border-top-right-radius: 6px; }}\n"
-        f"QTabBar::tab:selected {{ background: {t['tab_selected']}; color: {t['text']}; }}\n"
-        f"QTabBar::tab:hover {{ background: {t['bg_hover']}; }}\n"
-        # --- Labels ---
-        f"QLabel {{ color: {t['text_secondary']}; font-size: 13px; }}\n"
-        # --- Inputs ---
-        f"QSpinBox, QComboBox, QLineEdit {{ background: {t['bg_alt']}; color: {input_text};"
-        f" border: 1px solid {t['border']}; border-radius: 4px;"
-        f" padding: 4px 8px; min-width: 80px; }}\n"
-        # --- SpinBox buttons/arrows ---
-        f"QSpinBox::up-button, QSpinBox::down-button {{ background: {t['bg_hover']};"
-        f" border: none; width: 16px; }}\n"
-        f"QSpinBox::up-arrow {{ image: none;"
-        f" border-left: 4px solid transparent; border-right: 4px solid transparent;"
-        f" border-bottom: 5px solid {arrow}; }}\n"
-        f"QSpinBox::down-arrow {{ image: none;"
-        f" border-left: 4px solid transparent; border-right: 4px solid transparent;"
-        f" border-top: 5px solid {arrow}; }}\n"
-        # --- Checkboxes ---
-        f"QCheckBox {{ color: {t['text_secondary']}; font-size: 13px; spacing: 8px; }}\n"
-        f"QCheckBox::indicator {{ width: 18px; height: 18px; border-radius: 3px;"
-        f" border: 1px solid {checkbox_border}; background: {t['bg_alt']}; }}\n"
-        f"QCheckBox::indicator:checked {{ background: {t['accent']};"
-        f" border-color: {t['accent']}; }}\n"
-        # --- Sliders ---
-        f"QSlider::groove:horizontal {{ height: 6px; background: {slider_groove};"
-        f" border-radius: 3px; }}\n"
-        f"QSlider::handle:horizontal {{ background: {t['accent']};"
-        f" width: 16px; height: 16px; margin: -5px 0; border-radius: 8px; }}\n"
-        f"QSlider::sub-page:horizontal {{ background: {t['accent']};"
-        f" border-radius: 3px; }}\n"
-        # --- Buttons ---
-        f"QPushButton {{ background: {t['bg_hover']}; color: {t['text_secondary']};"
-        f" border: 1px solid {t['border']}; border-radius: 6px;"
-        f" padding: 6px 16px; font-size: 13px; }}\n"
-        f"QPushButton:hover {{ background: {button_hover}; }}\n"
-        f"QPushButton:pressed {{ background: {t['bg_pressed']}; }}\n"
-        # --- GroupBox ---
-        f"QGroupBox {{ color: {groupbox_color}; border: 1px solid {groupbox_border};"
-        f" border-radius: 6px; margin-top: 12px; padding-top: 16px;"
-        f" font-size: 12px; }}\n"
-        f"QGroupBox::title {{ subcontrol-origin: margin; left: 12px;"
-        f" padding: 0 6px; }}\n"
-        # --- ComboBox dropdown ---
-        f"QComboBox::drop-down {{ border: none; width: 20px; }}\n"
-        f"QComboBox::down-arrow {{ image: none;"
-        f" border-left: 4px solid transparent; border-right: 4px solid transparent;"
-        f" border-top: 5px solid {arrow}; }}\n"
-        f"QComboBox QAbstractItemView {{ background: {t['bg_alt']}; color: {input_text};"
-        f" selection-background-color: {t['accent']};"
-        f" border: 1px solid {t['border']}; }}\n"
-    )
+    for name, tokens in THEMES.items():
+        if tokens is theme:
+            return _build_dialog_stylesheet(name)
+    return _compose_dialog_stylesheet(theme)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_dialog_stylesheet(name: str) -> str:
+    """Memoized stylesheet build, keyed on the (hashable) theme name."""
+    return _compose_dialog_stylesheet(THEMES[name])
+
+
+def _compose_dialog_stylesheet(theme: dict) -> str:
+    """Assemble the stylesheet string from *theme* tokens.
+
+    One C-level substitution pass over the module-level template instead
+    of dozens of per-rule interpolations; the placeholders are exactly
+    the (augmented) theme keys.
+    """
+    return _STYLESHEET_TEMPLATE.format_map(theme)
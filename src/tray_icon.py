@@ -29,6 +29,22 @@ class ClaudeNotchTray(QSystemTrayIcon):
         self._last_icon_text = None
         self._last_tooltip = None
 
+        # Rendered icons keyed by (color, text) — only a handful of
+        # category/letter combinations ever occur, so each QPixmap paint
+        # happens once. FIFO-capped as a safety net.
+        self._icon_cache: dict = {}
+
+        # Icon refresh is driven by this flag: signal handlers mark it and
+        # the 1s tick repaints once, so idle ticks skip the session/color
+        # lookups entirely.
+        self._dirty = False
+
+        # show_category_letter, cached — read on every repaint but only
+        # changes via the settings dialog.
+        self._show_letter = True
+        if self.user_settings:
+            self._show_letter = self.user_settings.get("show_category_letter")
+
         # Create initial icon
         self._update_icon()
 
@@ -151,10 +167,7 @@ class ClaudeNotchTray(QSystemTrayIcon):
     def _update_icon(self):
         """Update tray icon based on current activity."""
         session = self.state_manager.get_current_session()
-
-        show_letter = True
-        if self.user_settings:
-            show_letter = self.user_settings.get("show_category_letter")
+        show_letter = self._show_letter
 
         if not session or not session.active_tool:
             # Idle - gray
@@ -183,21 +196,27 @@ class ClaudeNotchTray(QSystemTrayIcon):
         self._last_icon_text = text
         self._last_tooltip = tooltip
 
-        icon = self._create_icon(color, text)
+        key = (color, text)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            if len(self._icon_cache) >= 32:
+                self._icon_cache.pop(next(iter(self._icon_cache)))
+            icon = self._icon_cache[key] = self._create_icon(color, text)
         self.setIcon(icon)
         self.setToolTip(tooltip)
 
     def _on_activity_changed(self):
         """Handle activity change signal."""
-        self._update_icon()
+        self._dirty = True
 
     def _on_session_updated(self, session_id: str):
         """Handle session update signal."""
-        self._update_icon()
+        self._dirty = True
 
     def _on_setting_changed(self, key: str):
         """React to user setting changes."""
         if key == "show_category_letter":
+            self._show_letter = self.user_settings.get("show_category_letter")
             self._update_icon()
         elif key == "mini_mode":
             self.mini_mode_action.setChecked(self.user_settings.get("mini_mode"))
@@ -216,8 +235,10 @@ class ClaudeNotchTray(QSystemTrayIcon):
         # Cleanup stale sessions
         self.state_manager.cleanup_stale_sessions()
 
-        # Update icon (in case something changed)
-        self._update_icon()
+        # Repaint only if a signal marked the icon dirty since last tick
+        if self._dirty:
+            self._dirty = False
+            self._update_icon()
 
     def _on_activated(self, reason):
         """Handle tray icon activation."""
@@ -8,6 +8,7 @@ import logging
 import os
 import tempfile
 import winreg
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Optional
 from PySide6.QtCore import QObject, QTimer, Signal
@@ -58,6 +59,9 @@ class UserSettings(QObject):
 
     settings_changed = Signal(str)  # emits the key name that changed
 
+    # Set of keys changed inside a batch() scope; None when not batching.
+    _batch_keys = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.settings_dir = Path.home() / "AppData" / "Roaming" / "claude-notch-windows"
@@ -65,6 +69,11 @@ class UserSettings(QObject):
         self._settings: Dict[str, Any] = dict(DEFAULTS)
         self._load()
 
+        # Cached get_startup_enabled result — the registry value only
+        # changes through set_startup_enabled, so one WinReg round-trip
+        # warms it for the life of the process.
+        self._startup_cached: Optional[bool] = None
+
         # Debounce timer — coalesces rapid saves (e.g. slider drags) into
         # a single file write, preventing main-thread freezes from disk I/O.
         self._save_timer = QTimer(self)
@@ -192,10 +201,34 @@ class UserSettings(QObject):
         if old == value:
             return
         self._settings[key] = value
-        self._save_timer.start()  # (re)start debounce — coalesces rapid changes
         logger.info(f"Setting changed: {key} = {value!r}")
+        if self._batch_keys is not None:
+            self._batch_keys.add(key)
+            return
+        self._save_timer.start()  # (re)start debounce — coalesces rapid changes
         self.settings_changed.emit(key)
 
+    @contextmanager
+    def batch(self):
+        """Coalesce a burst of set() calls into one debounced save.
+
+        Inside the scope, set() updates the in-memory dict but defers the
+        save timer and settings_changed emissions; on exit each changed
+        key is emitted once. Nests harmlessly.
+        """
+        if self._batch_keys is not None:
+            yield
+            return
+        self._batch_keys = set()
+        try:
+            yield
+        finally:
+            keys, self._batch_keys = self._batch_keys, None
+            if keys:
+                self._save_timer.start()
+                for key in keys:
+                    self.settings_changed.emit(key)
+
     def get_all(self) -> Dict[str, Any]:
         """Get a copy of all settings."""
         return dict(self._settings)
@@ -213,7 +246,14 @@ class UserSettings(QObject):
     # --- Windows startup helpers ---
 
     def get_startup_enabled(self) -> bool:
-        """Check if launch-on-startup is registered in the Windows registry."""
+        """Check if launch-on-startup is registered in the Windows registry (cached)."""
+        if self._startup_cached is None:
+            self._startup_cached = self._query_startup_enabled()
+        return self._startup_cached
+
+    @staticmethod
+    def _query_startup_enabled() -> bool:
+        """Hit the registry for the startup entry."""
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, STARTUP_REG_KEY, 0, winreg.KEY_READ) as key:
                 winreg.QueryValueEx(key, STARTUP_REG_NAME)
@@ -225,6 +265,7 @@ class UserSettings(QObject):
 
     def set_startup_enabled(self, enabled: bool):
         """Add or remove the app from Windows startup via registry."""
+        self._startup_cached = None  # re-query after the write below
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, STARTUP_REG_KEY, 0, winreg.KEY_SET_VALUE) as key:
                 if enabled:
@@ -208,7 +208,7 @@ class TestStateManager:
         session = sm.sessions["s1"]
         session.is_active = False
         session.active_tool = None
-        session.last_activity = time.time() - 9999
+        session.last_activity = time.monotonic() - 9999
         sm.cleanup_stale_sessions()
         assert "s1" not in sm.sessions
 
@@ -224,7 +224,7 @@ class TestStateManager:
         session = sm.sessions["s1"]
         session.is_active = False
         session.active_tool = None
-        session.last_activity = time.time() - 9999
+        session.last_activity = time.monotonic() - 9999
         sm.cleanup_stale_sessions()
         assert "s1" in sm.sessions  # pinned, not removed
 
@@ -314,11 +314,11 @@ class TestSessionState:
 
     def test_is_stale(self):
         s = SessionState(session_id="s1", project_path="", project_name="")
-        s.last_activity = time.time() - 100
+        s.last_activity = time.monotonic() - 100
         assert s.is_stale
 
     def test_is_stale_at_custom(self):
         s = SessionState(session_id="s1", project_path="", project_name="")
-        s.last_activity = time.time() - 30
+        s.last_activity = time.monotonic() - 30
         assert not s.is_stale_at(60)
         assert s.is_stale_at(20)
@@ -129,7 +129,7 @@ class TestTokenThrottling:
         })
         session = sm.sessions["s1"]
         # Set last read to just now (within the 5s throttle window)
-        session.last_token_read_time = time.time()
+        session.last_token_read_time = time.monotonic()
 
         with patch("threading.Thread") as mock_thread:
             sm._update_token_usage(session, {"transcriptPath": str(tmp_path / "t.jsonl")})
@@ -146,7 +146,7 @@ class TestTokenThrottling:
         })
         session = sm.sessions["s1"]
         # Set last read to 10 seconds ago (past the 5s throttle window)
-        session.last_token_read_time = time.time() - 10
+        session.last_token_read_time = time.monotonic() - 10
 
         with patch("state_manager.threading.Thread") as mock_thread:
             mock_instance = MagicMock()